@@ -0,0 +1,33 @@
+"""Add plugins workspace/state index
+
+Revision ID: 8e2f4b6c1a73
+Revises: 073ed29a9363
+Create Date: 2026-10-17 09:30:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "8e2f4b6c1a73"
+down_revision: Union[str, None] = "073ed29a9363"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_plugins_ws_state",
+        "plugins",
+        ["workspace_id", "state"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_plugins_ws_state", table_name="plugins")
@@ -0,0 +1,27 @@
+"""Add prompts prompt_id index
+
+Revision ID: a3d9c2e7f514
+Revises: 8e2f4b6c1a73
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a3d9c2e7f514"
+down_revision: Union[str, None] = "8e2f4b6c1a73"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("idx_prompts_prompt_id", "prompts", ["prompt_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_prompts_prompt_id", table_name="prompts")
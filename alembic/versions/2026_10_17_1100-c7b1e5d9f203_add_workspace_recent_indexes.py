@@ -0,0 +1,37 @@
+"""Add workspace recent-item indexes
+
+Revision ID: c7b1e5d9f203
+Revises: a3d9c2e7f514
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c7b1e5d9f203"
+down_revision: Union[str, None] = "a3d9c2e7f514"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ("projects", "prompts", "credentials")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.create_index(
+            f"ix_{table}_workspace_updated",
+            table,
+            ["workspace_id", sa.text("updated_at DESC")],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_index(f"ix_{table}_workspace_updated", table_name=table)
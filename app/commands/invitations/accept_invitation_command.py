@@ -90,14 +90,17 @@ class AcceptInvitationCommand:
             membership = self.membership_service.create_membership(membership_data)
 
             # If the invitation includes project assignments, create project memberships too
-            for assignment in project_assignments:
-                pm_data = ProjectMembershipCreate(
-                    user_id=accepted_by_id,
-                    project_id=assignment.get("id"),
-                    role=assignment.get("role", MembershipRoles.COLLABORATOR),
-                    created_by_id=inviter_id,
-                )
-                self.project_membership_service.create_project_membership(pm_data)
+            self.project_membership_service.create_project_memberships(
+                [
+                    ProjectMembershipCreate(
+                        user_id=accepted_by_id,
+                        project_id=assignment.get("id"),
+                        role=assignment.get("role", MembershipRoles.COLLABORATOR),
+                        created_by_id=inviter_id,
+                    )
+                    for assignment in project_assignments
+                ]
+            )
 
             return membership
 
@@ -1,5 +1,6 @@
 # pyright: reportMissingTypeStubs=false
 from celery import Celery
+from celery.signals import worker_process_init, worker_process_shutdown
 from app.config import get_settings
 
 settings = get_settings()
@@ -25,3 +26,27 @@ celery_app.conf.update(
 )
 
 celery_app.autodiscover_tasks(["app.tasks"])  # ensure tasks are registered explicitly
+
+
+@worker_process_init.connect
+def warm_db_pool(**_kwargs) -> None:
+    """
+    Give each forked worker process its own warm database pool.
+
+    Connections inherited from the parent process must not be shared, so the
+    pool is reset without closing them, then one connection is opened up
+    front so the first task doesn't pay for the handshake.
+    """
+    from app.db import engine
+
+    engine.dispose(close=False)
+    with engine.connect():
+        pass
+
+
+@worker_process_shutdown.connect
+def close_db_pool(**_kwargs) -> None:
+    """Close a worker process's pooled connections when the process exits."""
+    from app.db import engine
+
+    engine.dispose()
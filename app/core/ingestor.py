@@ -1,9 +1,14 @@
 from app.config import get_settings
 from llama_index.core import StorageContext
 from llama_index.core import VectorStoreIndex
-from llama_index.core.schema import Document
+from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.schema import (
+    NodeRelationship,
+    RelatedNodeInfo,
+    TextNode,
+)
 from llama_index.core.base.embeddings.base import BaseEmbedding
-from typing import Optional
+from typing import List, Optional
 from llama_index.vector_stores.postgres import PGVectorStore
 from app.core.telemetry import instrument_method
 from app.core.storage_manager import StorageManager
@@ -33,37 +38,80 @@ class Ingestor:
         self.settings = get_settings()
         self.storage = storage or StorageManager()
 
-    @instrument_method()
-    def ingest_raw_text(
-        self, ref_id: str, text: str, labels: Optional[dict[str, str]] = None
-    ):
-        """Ingest raw text into the vector store.
+    @staticmethod
+    def split_raw_text(text: str) -> List[str]:
+        """Split raw text into the chunks stored for it by ``ingest_chunks``.
+
+        Args:
+            text (str): Raw text content to be split
+
+        Returns:
+            List[str]: The chunk texts, in document order
+        """
+        return SentenceSplitter().split_text(text)
+
+    @staticmethod
+    def chunk_id_prefix(ref_id: str, version: str) -> str:
+        """Return the node id prefix shared by every chunk of one ingestion run.
 
         Args:
             ref_id (str): Unique identifier for the document
-            text (str): Raw text content to be ingested
-            labels (Optional[dict[str, str]]): Optional metadata labels for the document
+            version (str): Identifier of the ingestion run
+
+        Returns:
+            str: The prefix of the run's chunk node ids
         """
-        print(labels)
-        # Create a document from the raw text
-        document = Document(
-            text=text,
-            id_=ref_id,
-            metadata=labels,
-        )
+        return f"{ref_id}:{version}:"
+
+    @instrument_method()
+    def ingest_chunks(
+        self,
+        ref_id: str,
+        version: str,
+        first_chunk_idx: int,
+        texts: List[str],
+        labels: Optional[dict[str, str]] = None,
+    ):
+        """Embed and store a run of consecutive chunks of a document.
+
+        The chunks are embedded in batches and inserted into the vector store
+        in a single transaction. Chunk ids are derived from the document, the
+        ingestion run and the chunk position. The vector store does not enforce
+        unique node ids, so any chunks left under the same ids by an earlier
+        attempt are deleted first, in a separate transaction. If the insert
+        then fails, this run's chunks are missing until the call is retried;
+        other runs' chunks are never touched.
 
-        # create (or load) docstore and add nodes
-        docstore = self.storage.get_docstore()
+        Args:
+            ref_id (str): Unique identifier for the document the chunks belong to
+            version (str): Identifier of the ingestion run
+            first_chunk_idx (int): Position of the first chunk within the document
+            texts (List[str]): The chunk texts, in document order
+            labels (Optional[dict[str, str]]): Optional metadata labels for the chunks
+        """
+        prefix = self.chunk_id_prefix(ref_id, version)
+        nodes = [
+            TextNode(
+                id_=f"{prefix}{chunk_idx}",
+                text=text,
+                metadata=labels or {},
+                relationships={
+                    NodeRelationship.SOURCE: RelatedNodeInfo(node_id=ref_id)
+                },
+            )
+            for chunk_idx, text in enumerate(texts, start=first_chunk_idx)
+        ]
+        self.vector_store.delete_nodes(node_ids=[node.node_id for node in nodes])
+        self._index().insert_nodes(nodes)
 
+    def _index(self) -> VectorStoreIndex:
+        """Open the vector index backed by this ingestor's store and docstore."""
         storage_context = StorageContext.from_defaults(
-            vector_store=self.vector_store, docstore=docstore
+            vector_store=self.vector_store, docstore=self.storage.get_docstore()
         )
-        index = VectorStoreIndex(
+        return VectorStoreIndex(
             [],
             storage_context=storage_context,
             embed_model=self.embedding_model,
             show_progress=False,
         )
-        # TODO: Make sure this is the correct way to update the document
-        # The update method will delete the document and insert a new one
-        index.update_ref_doc(document)
@@ -139,7 +139,9 @@ class WorkflowManager:
 
     def enabled_plugins(self):
         plugin_service = PluginService(self.db_session)
-        return plugin_service.get_project_plugins(self.project.id)
+        return plugin_service.get_project_plugins(
+            self.project.id, include_metadata=False
+        )
 
     def _convert_to_function_tool(self, tool: MCPTool) -> FunctionTool:
         """Convert a FastMCP Tool to a LlamaIndex FunctionTool."""
@@ -1,5 +1,5 @@
 from app.models.mixins import TimestampMixin, SoftDeleteMixin
-from sqlalchemy import Column, String, ForeignKey, LargeBinary
+from sqlalchemy import Column, String, ForeignKey, LargeBinary, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -12,6 +12,15 @@ class Credential(Base, TimestampMixin, SoftDeleteMixin):
 
     __tablename__ = "credentials"
 
+    __table_args__ = (
+        Index(
+            "ix_credentials_workspace_updated",
+            "workspace_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     type = Column(String(50), nullable=False)
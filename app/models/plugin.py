@@ -1,6 +1,6 @@
 from sqlalchemy_json import mutable_json_type
 from app.models.mixins import TimestampMixin, SoftDeleteMixin
-from sqlalchemy import Boolean, Column, String, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Boolean, Column, String, ForeignKey, Index, text, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 import uuid
@@ -14,6 +14,15 @@ class Plugin(Base, TimestampMixin, SoftDeleteMixin):
 
     __tablename__ = "plugins"
 
+    __table_args__ = (
+        Index(
+            "ix_plugins_ws_state",
+            "workspace_id",
+            "state",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
     description = Column(String, nullable=True)
@@ -1,6 +1,6 @@
 from typing import Any
 from app.models.mixins import TimestampMixin, SoftDeleteMixin
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Integer, String, ForeignKey, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy_json import mutable_json_type  # type: ignore
@@ -124,6 +124,15 @@ class Project(Base, TimestampMixin, SoftDeleteMixin):
 
     __tablename__ = "projects"
 
+    __table_args__ = (
+        Index(
+            "ix_projects_workspace_updated",
+            "workspace_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(50), nullable=False)
     description = Column(String, nullable=True)
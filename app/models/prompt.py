@@ -1,5 +1,5 @@
 from app.models.mixins import TimestampMixin, SoftDeleteMixin
-from sqlalchemy import Column, String, ForeignKey, Text, UniqueConstraint
+from sqlalchemy import Column, String, ForeignKey, Text, UniqueConstraint, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -32,6 +32,13 @@ class Prompt(Base, TimestampMixin, SoftDeleteMixin):
         UniqueConstraint(
             "workspace_id", "prompt_id", name="uq_prompts_workspace_id_prompt_id"
         ),
+        Index("idx_prompts_prompt_id", "prompt_id"),
+        Index(
+            "ix_prompts_workspace_updated",
+            "workspace_id",
+            text("updated_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
     )
 
     def __repr__(self):
@@ -44,7 +44,6 @@ from app.core.index_manager import IndexManager
 from app.services.node_service import NodeService
 from llama_index.core.response_synthesizers import ResponseMode
 from llama_index.core import get_response_synthesizer
-from llama_index.core import PromptTemplate
 
 router = APIRouter(prefix="/projects", tags=["workspace-projects"])
 
@@ -17,7 +17,6 @@ router = APIRouter(
     tags=["summarize"],
     responses={404: {"description": "Not found"}},
 )
-from llama_index.core.prompts import RichPromptTemplate
 
 
 class SummarizeRequest(BaseModel):
@@ -4,7 +4,6 @@ from app.services.project_service import ProjectService
 from app.utils.auth import get_current_user
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-import pprint
 
 from app.db import get_db
 from app.schemas.workspace import (
@@ -14,7 +13,6 @@ from app.schemas.workspace import (
     WorkspaceStats,
 )
 from app.services.workspace_service import WorkspaceService
-from app.schemas.common import ListResponse
 from app.routers.utils.dependencies import get_workspace_by_id
 from app.exceptions.workspace_exceptions import WorkspaceLockedError
 from fastapi_pagination import Page
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload, Query
-from sqlalchemy import and_
+from sqlalchemy import and_, bindparam, select
 
 from app.models.invitation import Invitation
 from app.schemas.invitation import InvitationCreate, InvitationUpdate
@@ -15,6 +15,13 @@ from app.exceptions.invitation_exceptions import (
 
 
 class InvitationService(SoftDeleteService[Invitation]):
+    # Built once and shared by every instance; only the id is bound per call.
+    _GET_INVITATION_STMT = (
+        select(Invitation)
+        .options(joinedload(Invitation.workspace), joinedload(Invitation.inviter))
+        .where(Invitation.id == bindparam("invitation_id"))
+    )
+
     def __init__(self, db: Session):
         super().__init__(db, Invitation)
 
@@ -40,12 +47,9 @@ class InvitationService(SoftDeleteService[Invitation]):
 
     def get_invitation(self, invitation_id: UUID) -> Optional[Invitation]:
         """Get an invitation by ID."""
-        return (
-            self.db.query(Invitation)
-            .options(joinedload(Invitation.workspace), joinedload(Invitation.inviter))
-            .filter(Invitation.id == invitation_id)
-            .first()
-        )
+        return self.db.execute(
+            self._GET_INVITATION_STMT, {"invitation_id": invitation_id}
+        ).scalar_one_or_none()
 
     def get_invitations_by_workspace(
         self,
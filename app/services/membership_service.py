@@ -2,7 +2,7 @@ from typing import List, Optional, Dict, Any
 from uuid import UUID
 from fastapi import HTTPException
 from sqlalchemy.orm import Session, joinedload, Query
-from sqlalchemy import and_
+from sqlalchemy import and_, or_, select
 from sqlalchemy.sql import false
 from app.constants.membership import MembershipRoles
 from app.models.membership import Membership
@@ -214,12 +214,21 @@ class MembershipService(SoftDeleteService[Membership]):
         - Otherwise, return all projects in the workspace.
         - If the user has no membership, return a query that yields no results.
         """
-        membership = self.get_user_workspace_membership(user_id, workspace_id)
-        if membership is None:
+        # Only the role decides access, so skip loading the Membership entity
+        role = (
+            self.db.query(Membership.role)
+            .filter(
+                Membership.user_id == user_id,
+                Membership.workspace_id == workspace_id,
+            )
+            .limit(1)
+            .scalar()
+        )
+        if role is None:
             # Return a query that will yield no results
             return self.db.query(Project).filter(false())
 
-        if membership.role == MembershipRoles.PROJECT_MEMBER:
+        if role == MembershipRoles.PROJECT_MEMBER:
             return (
                 self.db.query(Project)
                 .join(
@@ -238,6 +247,43 @@ class MembershipService(SoftDeleteService[Membership]):
         # Owners/admins/collaborators: full access to workspace projects
         return self.db.query(Project).filter(Project.workspace_id == workspace_id)
 
+    @staticmethod
+    def accessible_projects_criterion(workspace_id: UUID, user_id: UUID) -> Any:
+        """Build a filter on Project matching the projects a user can access.
+
+        Applies the same rules as get_accessible_projects_query_for_user, but
+        the user's role is read by a sub-select inside the filter, so callers
+        can embed it in a larger statement without a separate round-trip.
+        """
+        role = (
+            select(Membership.role)
+            .where(
+                Membership.user_id == user_id,
+                Membership.workspace_id == workspace_id,
+            )
+            .limit(1)
+            .scalar_subquery()
+        )
+        has_project_membership = (
+            select(ProjectMembership.id)
+            .where(
+                ProjectMembership.project_id == Project.id,
+                ProjectMembership.user_id == user_id,
+            )
+            .exists()
+        )
+        # Without a membership the role is NULL and neither branch matches
+        return and_(
+            Project.workspace_id == workspace_id,
+            or_(
+                role != MembershipRoles.PROJECT_MEMBER,
+                and_(
+                    role == MembershipRoles.PROJECT_MEMBER,
+                    has_project_membership,
+                ),
+            ),
+        )
+
     def validate_delete_membership_permissions(
         self, membership_id: UUID, current_user_id: UUID, workspace_id: UUID
     ) -> None:
@@ -1,6 +1,7 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from sqlalchemy.orm import Session, Query
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, Query, defer
 from app.constants.plugin_states import PluginState
 from app.models.plugin import Plugin
 from app.models.project_plugin import ProjectPlugin
@@ -8,6 +9,26 @@ from app.models.project import Project
 from app.schemas.plugin import PluginCreate, PluginUpdate
 from app.services.soft_delete_service import SoftDeleteService
 
+# Only column-mapped fields are serialized when building Plugin rows.
+_PLUGIN_COLUMNS = frozenset(Plugin.__table__.columns.keys())
+
+# Large JSONB payloads of a project plugin installation. They are only ever
+# overwritten by the service, never read, so lookups leave them unloaded.
+_PROJECT_PLUGIN_DEFERRED = (
+    defer(ProjectPlugin.config),
+    defer(ProjectPlugin.tools),
+    defer(ProjectPlugin.resources),
+    defer(ProjectPlugin.prompts),
+)
+
+# Plugin catalogue data that is not needed to connect to a plugin and load its
+# tools at runtime.
+_PLUGIN_RUNTIME_DEFERRED = (
+    defer(Plugin.plugin_metadata),
+    defer(Plugin.resources),
+    defer(Plugin.prompts),
+)
+
 
 class PluginService(SoftDeleteService[Plugin]):
     """Service for managing plugin registration and configuration."""
@@ -20,18 +41,15 @@ class PluginService(SoftDeleteService[Plugin]):
         plugin = self.get_plugin(plugin_id)
         plugin.state = state
         self.db.commit()
-        self.db.refresh(plugin)
         return plugin
 
     def create_plugin(self, plugin_data: PluginCreate) -> Plugin:
         """Register a new plugin in the system."""
         # Create plugin with INITIALIZING state
-        plugin = Plugin(**plugin_data.model_dump())
+        plugin = Plugin(**plugin_data.model_dump(include=_PLUGIN_COLUMNS))
         plugin.state = PluginState.INITIALIZING
         self.db.add(plugin)
         self.db.commit()
-        self.db.refresh(plugin)
-
         return plugin
 
     def find_plugin(self, plugin_id: UUID) -> Optional[Plugin]:
@@ -52,7 +70,6 @@ class PluginService(SoftDeleteService[Plugin]):
         for key, value in update_data.items():
             setattr(plugin, key, value)
         self.db.commit()
-        self.db.refresh(plugin)
         return plugin
 
     def delete_plugin(self, plugin_id: UUID) -> bool:
@@ -106,6 +123,7 @@ class PluginService(SoftDeleteService[Plugin]):
         # Check if plugin is already installed
         project_plugin = (
             self.db.query(ProjectPlugin)
+            .options(*_PROJECT_PLUGIN_DEFERRED)
             .filter(
                 ProjectPlugin.project_id == project_id,
                 ProjectPlugin.plugin_id == plugin_id,
@@ -123,7 +141,6 @@ class PluginService(SoftDeleteService[Plugin]):
             if prompts is not None:
                 project_plugin.prompts = prompts
             self.db.commit()
-            self.db.refresh(project_plugin)
             return project_plugin
 
         # Create new plugin installation
@@ -137,13 +154,13 @@ class PluginService(SoftDeleteService[Plugin]):
         )
         self.db.add(project_plugin)
         self.db.commit()
-        self.db.refresh(project_plugin)
         return project_plugin
 
     def disable_plugin_in_project(self, project_id: UUID, plugin_id: UUID) -> bool:
         """Disable a plugin in a project."""
         project_plugin = (
             self.db.query(ProjectPlugin)
+            .options(*_PROJECT_PLUGIN_DEFERRED)
             .filter(
                 ProjectPlugin.project_id == project_id,
                 ProjectPlugin.plugin_id == plugin_id,
@@ -156,42 +173,52 @@ class PluginService(SoftDeleteService[Plugin]):
             return True
         return False
 
-    def get_project_plugins(self, project_id: UUID) -> List[Plugin]:
-        """Get all enabled plugins for a project."""
-        project = self.db.query(Project).filter(Project.id == project_id).first()
+    def get_project_plugins(
+        self, project_id: UUID, include_metadata: bool = True
+    ) -> List[Plugin]:
+        """Get all enabled plugins for a project.
 
-        if not project:
-            return []
+        Global plugins of the project's workspace and plugins enabled in the
+        project are resolved in a single query. The unique constraint on
+        (project_id, plugin_id) guarantees the outer join yields at most one
+        row per plugin, so no Python-side deduplication is required.
 
-        # Get all plugins from the project's workspace
-        global_workspace_plugins = self.get_global_workspace_plugins(
-            project.workspace_id
-        )
-
-        # Get project-specific plugin configurations
-        project_plugins = (
-            self.db.query(Plugin)
-            .join(ProjectPlugin, ProjectPlugin.plugin_id == Plugin.id)
-            .filter(ProjectPlugin.project_id == project_id, ProjectPlugin.is_enabled)
+        Args:
+            project_id: The UUID of the project
+            include_metadata: When False, the plugin metadata, resources and
+                prompts columns are deferred; only what is needed to connect
+                to the plugins and load their tools is fetched.
+        """
+        query = self.db.query(Plugin)
+        if not include_metadata:
+            query = query.options(*_PLUGIN_RUNTIME_DEFERRED)
+        return (
+            query.join(Project, Project.id == project_id)
+            .outerjoin(
+                ProjectPlugin,
+                and_(
+                    ProjectPlugin.plugin_id == Plugin.id,
+                    ProjectPlugin.project_id == Project.id,
+                    ProjectPlugin.is_enabled,
+                ),
+            )
+            .filter(
+                or_(
+                    ProjectPlugin.id.isnot(None),
+                    and_(
+                        Plugin.workspace_id == Project.workspace_id,
+                        Plugin.is_enabled,
+                        Plugin.is_global,
+                    ),
+                )
+            )
+            .order_by(Plugin.created_at, Plugin.id)
             .all()
         )
 
-        # Combine plugins and remove duplicates based on plugin ID
-        all_plugins = {}
-
-        # Add global plugins first
-        for plugin in global_workspace_plugins:
-            all_plugins[plugin.id] = plugin
-
-        # Add project plugins (will override global plugins if same ID)
-        for plugin in project_plugins:
-            all_plugins[plugin.id] = plugin
-
-        return list(all_plugins.values())
-
     def get_project_tools(self, project_id: UUID) -> List[Dict[str, Any]]:
         """Get all enabled plugins for a project."""
-        plugins = self.get_project_plugins(project_id)
+        plugins = self.get_project_plugins(project_id, include_metadata=False)
         # Flatten the list of tools from all plugins, handling None values
         all_tools: List[Dict[str, Any]] = []
         for plugin in plugins:
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 
 from app.models.project_membership import ProjectMembership
 from app.schemas.project_membership import (
@@ -10,6 +10,7 @@ from app.schemas.project_membership import (
 )
 from app.utils.db.filtering import apply_filters
 from app.services.soft_delete_service import SoftDeleteService
+from app.services.workspace_service import mark_workspace_stats_stale
 
 
 class ProjectMembershipService(SoftDeleteService[ProjectMembership]):
@@ -81,9 +82,38 @@ class ProjectMembershipService(SoftDeleteService[ProjectMembership]):
         db_membership = ProjectMembership(**membership.model_dump())
         self.db.add(db_membership)
         self.db.commit()
-        self.db.refresh(db_membership)
         return db_membership
 
+    def create_project_memberships(
+        self, memberships: List[ProjectMembershipCreate]
+    ) -> List[ProjectMembership]:
+        """Create several project memberships with a single executemany INSERT.
+
+        Args:
+            memberships: The memberships to create
+
+        Returns:
+            List[ProjectMembership]: The created memberships, in input order
+        """
+        if not memberships:
+            return []
+
+        rows = [membership.model_dump() for membership in memberships]
+        db_memberships = list(
+            self.db.scalars(
+                insert(ProjectMembership).returning(
+                    ProjectMembership, sort_by_parameter_order=True
+                ),
+                rows,
+            )
+        )
+        # Bulk INSERTs bypass the flush hooks that invalidate workspace stats
+        mark_workspace_stats_stale(
+            self.db, project_ids={membership.project_id for membership in memberships}
+        )
+        self.db.commit()
+        return db_memberships
+
     def update_project_membership(
         self, membership_id: UUID, membership: ProjectMembershipUpdate
     ) -> Optional[ProjectMembership]:
@@ -97,7 +127,6 @@ class ProjectMembershipService(SoftDeleteService[ProjectMembership]):
             for key, value in update_data.items():
                 setattr(db_membership, key, value)
             self.db.commit()
-            self.db.refresh(db_membership)
         return db_membership
 
     def delete_project_membership(self, membership_id: UUID) -> bool:
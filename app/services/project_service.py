@@ -1,9 +1,10 @@
+from functools import cached_property
 from typing import List, Optional, Dict, Any, cast
 from uuid import UUID
 from app.config import get_settings
 from app.constants.providers import OPENAI_PROVIDER, LLMProviderType
 from app.exceptions.resource_not_found_error import ResourceNotFoundError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 from app.models.project import Project
 from app.models.workspace import Workspace
 from app.schemas.project import ProjectCreate, ProjectUpdate, Project as ProjectSchema
@@ -12,11 +13,21 @@ from app.utils.db.filtering import apply_filters
 from app.core.index_manager import IndexManager
 from app.services.soft_delete_service import SoftDeleteService
 
+# Only column-mapped fields are serialized when building Project rows.
+_PROJECT_COLUMNS = frozenset(Project.__table__.columns.keys())
+
+# Fields filled from the workspace or application settings when omitted.
+_DEFAULTED_FIELDS = ("llm_provider", "embed_model", "embed_dim", "llm", "system_prompt")
+
 
 class ProjectService(SoftDeleteService[Project]):
     def __init__(self, db: Session):
         super().__init__(db, Project)
-        self.workspace_service = WorkspaceService(db)
+
+    @cached_property
+    def workspace_service(self) -> WorkspaceService:
+        # Only project creation needs workspace lookups; build it on demand.
+        return WorkspaceService(self.db)
 
     def get_project(self, project_id: UUID) -> Optional[Project]:
         return self.db.query(Project).filter(Project.id == project_id).one_or_none()
@@ -33,12 +44,11 @@ class ProjectService(SoftDeleteService[Project]):
             )
 
         project = self._set_project_defaults(project, workspace)
-        data = project.model_dump()
+        data = project.model_dump(include=_PROJECT_COLUMNS)
 
         db_project = Project(**data)
         self.db.add(db_project)
         self.db.commit()
-        self.db.refresh(db_project)
 
         # Create the vector index table
         # TODO: Handle errors
@@ -56,7 +66,6 @@ class ProjectService(SoftDeleteService[Project]):
             for key, value in update_data.items():
                 setattr(db_project, key, value)
             self.db.commit()
-            self.db.refresh(db_project)
         return db_project
 
     def delete_project(self, project_id: UUID) -> bool:
@@ -68,11 +77,9 @@ class ProjectService(SoftDeleteService[Project]):
             index_manager.drop_index()  # Ensure IndexManager has a method to drop the index
 
             # Then soft delete the project
-            return self.delete_record(project_id)
+            return self.soft_delete(db_project)
         return False
 
-    # moved to NodeService
-
     def search(self, filters: Dict[str, Any]) -> List[ProjectSchema]:
         """
         Search projects based on provided filters.
@@ -85,30 +92,35 @@ class ProjectService(SoftDeleteService[Project]):
         Returns:
             List[ProjectSchema]: List of projects matching the filter criteria.
         """
-        query = self.db.query(Project)
+        # Only columns are serialized; fail loudly on any relationship access
+        query = self.db.query(Project).options(raiseload("*"))
         query = apply_filters(query, Project, filters)
         return [ProjectSchema.model_validate(project) for project in query.all()]
 
     def _set_project_defaults(
         self, project: ProjectCreate, workspace: Workspace
     ) -> ProjectCreate:
+        if all(getattr(project, field) is not None for field in _DEFAULTED_FIELDS):
+            return project
+
+        settings = get_settings()
         if project.llm_provider is None:
             project.llm_provider = workspace.default_llm_provider or cast(
                 LLMProviderType, OPENAI_PROVIDER
             )
         if project.embed_model is None:
             project.embed_model = (
-                workspace.default_embed_model or get_settings().default_embed_model
+                workspace.default_embed_model or settings.default_embed_model
             )
         if project.embed_dim is None:
             project.embed_dim = (
-                workspace.default_embed_dim or get_settings().default_embed_dim
+                workspace.default_embed_dim or settings.default_embed_dim
             )
         if project.llm is None:
-            project.llm = workspace.default_llm or get_settings().default_llm
+            project.llm = workspace.default_llm or settings.default_llm
         if project.system_prompt is None:
             project.system_prompt = (
-                workspace.system_prompt or get_settings().default_system_prompt
+                workspace.system_prompt or settings.default_system_prompt
             )
 
         return project
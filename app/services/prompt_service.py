@@ -1,10 +1,13 @@
 from typing import List, Optional, Dict, Any, Union
 from uuid import UUID
+from sqlalchemy import or_
 from sqlalchemy.orm import Session, Query
 from app.models.prompt import Prompt
 from app.schemas.prompt import PromptCreate, PromptUpdate
 from app.utils.db.filtering import apply_filters
+from app.utils.db.rows import changed_values, row_values
 from app.services.soft_delete_service import SoftDeleteService
+from app.services.workspace_service import mark_workspace_stats_stale
 
 """
 Module providing the PromptService class for managing Prompt entities.
@@ -16,6 +19,9 @@ class PromptService(SoftDeleteService[Prompt]):
     def __init__(self, db: Session):
         super().__init__(db, Prompt)
 
+    def _mark_changed(self, record: Prompt) -> None:
+        mark_workspace_stats_stale(self.db, [record.workspace_id])
+
     def get_prompt(self, prompt_id: UUID) -> Optional[Prompt]:
         """Fetch a single prompt by ID."""
         return self.db.query(Prompt).filter(Prompt.id == prompt_id).first()
@@ -40,19 +46,22 @@ class PromptService(SoftDeleteService[Prompt]):
         """
         if isinstance(identifier, UUID):
             return self.get_prompt(identifier)
-        elif isinstance(identifier, str):
-            # Check if the string is a valid UUID
-            try:
-                uuid_identifier = UUID(identifier)
-                # Try to find by ID first
-                result = self.get_prompt(uuid_identifier)
-                if result is not None:
-                    return result
-                # If not found by ID, try by prompt_id
-                return self.get_prompt_by_prompt_id(identifier)
-            except (ValueError, TypeError):
-                # If not a valid UUID, treat as prompt_id string
-                return self.get_prompt_by_prompt_id(identifier)
+
+        try:
+            uuid_identifier = UUID(identifier)
+        except (ValueError, TypeError):
+            # If not a valid UUID, treat as prompt_id string
+            return self.get_prompt_by_prompt_id(identifier)
+
+        # A UUID-shaped string may be either field: match both in one query,
+        # preferring the row whose primary key matches.
+        id_match = Prompt.id == uuid_identifier
+        return (
+            self.db.query(Prompt)
+            .filter(or_(id_match, Prompt.prompt_id == identifier))
+            .order_by(id_match.desc())
+            .first()
+        )
 
     def get_prompts(self, skip: int = 0, limit: int = 100) -> List[Prompt]:
         """Fetch a list of prompts with pagination."""
@@ -60,22 +69,15 @@ class PromptService(SoftDeleteService[Prompt]):
 
     def create_prompt(self, prompt: PromptCreate) -> Prompt:
         """Create a new prompt."""
-        db_prompt = Prompt(**prompt.model_dump())
+        db_prompt = Prompt(**row_values(prompt))
         self.db.add(db_prompt)
         self.db.commit()
-        self.db.refresh(db_prompt)
         return db_prompt
 
     def update_prompt(self, prompt_id: UUID, prompt: PromptUpdate) -> Optional[Prompt]:
         """Update an existing prompt."""
-        db_prompt = self.db.query(Prompt).filter(Prompt.id == prompt_id).first()
-        if db_prompt:
-            update_data = prompt.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(db_prompt, key, value)
-            self.db.commit()
-            self.db.refresh(db_prompt)
-        return db_prompt
+        update_data = changed_values(prompt)
+        return self.update_record(prompt_id, update_data)
 
     def delete_prompt(self, prompt_id: UUID) -> bool:
         """Soft delete a prompt and return a boolean indicating success."""
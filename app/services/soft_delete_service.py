@@ -1,6 +1,7 @@
-from typing import List, Optional, TypeVar, Generic, Type
+from typing import Any, Dict, List, Optional, TypeVar, Generic, Type
 from uuid import UUID
 from datetime import datetime, timezone
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from app.db import Base
 
@@ -44,11 +45,69 @@ class SoftDeleteService(Generic[T]):
         )
 
         if record:
-            record.deleted_at = datetime.now(timezone.utc)
-            self.db.commit()
-            return True
+            return self.soft_delete(record)
         return False
 
+    def soft_delete(self, record: T) -> bool:
+        """
+        Soft delete an already loaded record by setting deleted_at timestamp.
+
+        Use this instead of delete_record when the caller has fetched the row
+        already, to avoid selecting it a second time.
+
+        Args:
+            record: The record to soft delete
+
+        Returns:
+            bool: Always True
+        """
+        record.deleted_at = datetime.now(timezone.utc)
+        self.db.commit()
+        return True
+
+    def update_record(self, record_id: UUID, values: Dict[str, Any]) -> Optional[T]:
+        """
+        Update a non-deleted record in a single UPDATE ... RETURNING statement.
+
+        Args:
+            record_id: The ID of the record to update
+            values: Column values to set; when empty, the record is only fetched
+
+        Returns:
+            Optional[T]: The updated record, or None if it doesn't exist or is deleted
+        """
+        if not values:
+            return (
+                self.db.query(self.model_class)
+                .filter(self.model_class.id == record_id)
+                .first()
+            )
+
+        record = self.db.execute(
+            update(self.model_class)
+            .where(
+                self.model_class.id == record_id,
+                self.model_class.deleted_at.is_(None),
+            )
+            .values(**values)
+            .returning(self.model_class)
+        ).scalar_one_or_none()
+        if record is not None:
+            self._mark_changed(record)
+            self.db.commit()
+        return record
+
+    def _mark_changed(self, record: T) -> None:
+        """
+        Hook called with a record changed by a Core statement, before commit.
+
+        Such statements bypass the unit of work, so flush events never see
+        them; subclasses override this to keep derived caches in step.
+
+        Args:
+            record: The changed record
+        """
+
     def delete_records(self, record_ids: List[UUID]) -> bool:
         """
         Soft delete multiple records by setting deleted_at timestamp.
@@ -1,27 +1,21 @@
+import functools
 import os
-import re
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
-from llama_index.core.prompts import PromptTemplate
-from app.core.index_manager import IndexManager
 from app.models.project import Project
 from app.schemas.ai_schemas.chat.chat_api_message import ChatAPIMessage
 from sqlalchemy.orm import Session
 from app.core.logging_config import get_logger
 
-logger = get_logger()
+if TYPE_CHECKING:
+    from llama_index.core.prompts import PromptTemplate
 
+logger = get_logger()
 
-class SuggestNextQuestionsService:
-    """
-    Suggest the next questions that user might ask based on the conversation history.
-    """
+# Delimiter of the fenced block holding the suggested questions.
+_FENCE = "```"
 
-    def __init__(self, db_session: Session, project: Project):
-        self.db_session = db_session
-        self.project = project
-        self.prompt = PromptTemplate(
-            r"""
+DEFAULT_NEXT_QUESTION_PROMPT = r"""
 You're a helpful assistant! Your task is to suggest the next questions that user might interested in to keep the conversation going.
 Here is the conversation history
 ---------------------
@@ -35,13 +29,36 @@ Your answer should be wrapped in three sticks without any index numbers and foll
 <question 3>
 \`\`\`
 """
-        )
 
-    def get_configured_prompt(self) -> PromptTemplate:
-        prompt = os.getenv("NEXT_QUESTION_PROMPT", None)
-        if not prompt:
-            return self.prompt
-        return PromptTemplate(prompt)
+
+@functools.cache
+def _configured_prompt() -> "PromptTemplate":
+    """
+    Resolve the next-question prompt template once per process.
+
+    ``NEXT_QUESTION_PROMPT`` overrides the default template; it is read on
+    first use and the parsed template is reused for every later request.
+    llama_index is imported here rather than at module load so workers that
+    never suggest questions don't pay for it.
+    """
+    from llama_index.core.prompts import PromptTemplate
+
+    return PromptTemplate(
+        os.getenv("NEXT_QUESTION_PROMPT") or DEFAULT_NEXT_QUESTION_PROMPT
+    )
+
+
+class SuggestNextQuestionsService:
+    """
+    Suggest the next questions that user might ask based on the conversation history.
+    """
+
+    def __init__(self, db_session: Session, project: Project):
+        self.db_session = db_session
+        self.project = project
+
+    def get_configured_prompt(self) -> "PromptTemplate":
+        return _configured_prompt()
 
     async def suggest_next_questions_all_messages(
         self,
@@ -50,23 +67,30 @@ Your answer should be wrapped in three sticks without any index numbers and foll
         """
         Suggest the next questions that user might ask based on the conversation history.
         """
+        # Reduce the cost by only using the last user and assistant messages
+        last_user_message = None
+        last_assistant_message = None
+        for message in reversed(messages):
+            if message.role == "user" and last_user_message is None:
+                last_user_message = f"User: {message.content}"
+            elif message.role == "assistant" and last_assistant_message is None:
+                last_assistant_message = f"Assistant: {message.content}"
+            if last_user_message and last_assistant_message:
+                break
+
+        # Without a full exchange there is nothing to suggest from; skip the LLM
+        if last_user_message is None or last_assistant_message is None:
+            return None
+
         prompt_template = self.get_configured_prompt()
 
         try:
-            # Reduce the cost by only using the last two messages
-            last_user_message = None
-            last_assistant_message = None
-            for message in reversed(messages):
-                if message.role == "user":
-                    last_user_message = f"User: {message.content}"
-                elif message.role == "assistant":
-                    last_assistant_message = f"Assistant: {message.content}"
-                if last_user_message and last_assistant_message:
-                    break
             conversation: str = f"{last_user_message}\n{last_assistant_message}"
 
             # Call the LLM and parse questions from the output
             prompt = prompt_template.format(conversation=conversation)
+            from app.core.index_manager import IndexManager
+
             llm = IndexManager(self.db_session, self.project).llm()
             output = await llm.acomplete(prompt)
             return self._extract_questions(output.text)
@@ -76,11 +100,19 @@ Your answer should be wrapped in three sticks without any index numbers and foll
             return None
 
     def _extract_questions(self, text: str) -> Union[List[str], None]:
-        content_match = re.search(r"```(.*?)```", text, re.DOTALL)
-        content = content_match.group(1) if content_match else None
+        # Take the body between the first fence and the next one; two
+        # substring searches are cheaper than a non-greedy DOTALL regex.
+        start = text.find(_FENCE)
+        if start == -1:
+            return None
+        start += len(_FENCE)
+        end = text.find(_FENCE, start)
+        if end == -1:
+            return None
+        content = text[start:end]
         if not content:
             return None
-        return [q.strip() for q in content.split("\n") if q.strip()]
+        return [q.strip() for q in content.splitlines() if q.strip()]
 
     async def run(
         self,
@@ -1,9 +1,18 @@
-from typing import List, Optional, Dict, Any, cast
-from datetime import datetime
+"""
+Module providing the WorkspaceService class for managing Workspace entities.
+Includes methods for CRUD operations and dynamic searching with flexible filters.
+"""
+
+import time
+from functools import cached_property
+from itertools import chain
+from typing import List, Optional, Dict, Any, Iterable
 from uuid import UUID
-from sqlalchemy.orm import Session, Query
-from sqlalchemy import func, desc, case
+from sqlalchemy.orm import Session, Query, joinedload
+from sqlalchemy import event, func, desc, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from app.models.membership import Membership
+from app.models.project_membership import ProjectMembership
 from app.models.workspace import Workspace
 from app.models.project import Project
 from app.models.prompt import Prompt
@@ -23,21 +32,142 @@ from app.schemas.workspace import (
     CredentialSummary,
 )
 from app.utils.db.filtering import apply_filters
+from app.utils.db.rows import changed_values, row_values
+from app.utils.cache import workspace_stats_cache
 from app.services.workspace_prune_service import WorkspacePruneService
 from app.services.soft_delete_service import SoftDeleteService
 from app.exceptions.workspace_exceptions import WorkspaceLockedError
 from app.services.membership_service import MembershipService
 
-"""
-Module providing the WorkspaceService class for managing Workspace entities.
-Includes methods for CRUD operations and dynamic searching with flexible filters.
-"""
+# Plugin states counted as enabled vs disabled in workspace stats.
+ENABLED_PLUGIN_STATES = frozenset(
+    {PluginState.RUNNING, PluginState.IDLE, PluginState.STARTING}
+)
+DISABLED_PLUGIN_STATES = frozenset(
+    {
+        PluginState.STOPPED,
+        PluginState.ERROR,
+        PluginState.REGISTERED,
+        PluginState.INITIALIZING,
+    }
+)
+
+# Workspace stats are served from cache for this many seconds at most; any
+# committed change to a workspace's resources invalidates its entry earlier.
+STATS_CACHE_TTL = 30
+
+# Each workspace's cached stats live in one hash: the unfiltered figures under
+# this field and each user's access-filtered figures under their user id.
+_ALL_USERS_FIELD = "*"
+
+# Models whose mutations change the figures reported by workspace stats.
+_STATS_MODELS = (Project, Prompt, Plugin, Credential, Membership)
+
+
+def _read_cached_stats(workspace_id: UUID, field: str) -> Optional[WorkspaceStats]:
+    """Return cached stats for a workspace/user pair if still fresh."""
+    cached = workspace_stats_cache.read_field(str(workspace_id), field)
+    if cached is None or time.time() - cached["cached_at"] > STATS_CACHE_TTL:
+        return None
+    return WorkspaceStats.model_validate(cached["stats"])
+
+
+def _write_cached_stats(workspace_id: UUID, field: str, stats: WorkspaceStats) -> None:
+    """Cache stats for a workspace/user pair, stamped with the time computed."""
+    workspace_stats_cache.write_field(
+        str(workspace_id),
+        field,
+        {"cached_at": time.time(), "stats": stats.model_dump(mode="json")},
+        ttl=STATS_CACHE_TTL,
+    )
+
+
+def _invalidate_workspace_stats(workspace_ids: Iterable[Any]) -> None:
+    """Drop the cached stats of the given workspaces."""
+    for workspace_id in workspace_ids:
+        if workspace_id is not None:
+            workspace_stats_cache.delete(str(workspace_id))
+
+
+def mark_workspace_stats_stale(
+    session: Session,
+    workspace_ids: Iterable[Any] = (),
+    project_ids: Iterable[Any] = (),
+) -> None:
+    """
+    Drop the cached stats of the given workspaces once the session commits.
+
+    Flushed ORM changes are picked up automatically; Core statements that
+    bypass the unit of work (bulk INSERTs, UPDATE ... RETURNING) call this
+    with the ids they touched before committing. Project ids are resolved to
+    their workspaces after the commit.
+
+    Args:
+        session: The session the change was made in
+        workspace_ids: Workspaces whose stats changed
+        project_ids: Projects whose workspace's stats changed
+    """
+    session.info.setdefault("stale_workspace_stats", set()).update(workspace_ids)
+    session.info.setdefault("stale_project_stats", set()).update(project_ids)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_stale_workspace_stats(session, flush_context):
+    """
+    Remember the workspaces whose resources were flushed.
+
+    Only ids are collected here; nothing is read or invalidated until the
+    change is committed and visible to other sessions, so a concurrent
+    reader can't re-cache the pre-commit figures.
+    """
+    workspace_ids = set()
+    project_ids = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, _STATS_MODELS):
+            workspace_ids.add(obj.workspace_id)
+        elif isinstance(obj, Workspace):
+            workspace_ids.add(obj.id)
+        elif isinstance(obj, ProjectMembership):
+            # Project access changes the member's per-user project figures
+            project_ids.add(obj.project_id)
+    if workspace_ids or project_ids:
+        mark_workspace_stats_stale(session, workspace_ids, project_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_workspace_stats(session):
+    workspace_ids = session.info.pop("stale_workspace_stats", set())
+    project_ids = session.info.pop("stale_project_stats", set())
+    project_ids.discard(None)
+    if project_ids:
+        # The committed session can't emit SQL; look the projects up on a
+        # short-lived session sharing its bind
+        with Session(bind=session.get_bind()) as lookup:
+            workspace_ids.update(
+                lookup.scalars(
+                    select(Project.workspace_id).where(Project.id.in_(project_ids))
+                )
+            )
+    _invalidate_workspace_stats(workspace_ids)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_stale_workspace_stats(session, previous_transaction):
+    session.info.pop("stale_workspace_stats", None)
+    session.info.pop("stale_project_stats", None)
 
 
 class WorkspaceService(SoftDeleteService[Workspace]):
     def __init__(self, db: Session):
         super().__init__(db, Workspace)
-        self.prune_service = WorkspacePruneService(db)
+
+    @cached_property
+    def prune_service(self) -> WorkspacePruneService:
+        # Only deletion needs pruning; build it on demand.
+        return WorkspacePruneService(self.db)
+
+    def _mark_changed(self, record: Workspace) -> None:
+        mark_workspace_stats_stale(self.db, [record.id])
 
     def get_workspace(self, workspace_id: UUID) -> Optional[Workspace]:
         return self.db.query(Workspace).filter(Workspace.id == workspace_id).first()
@@ -57,11 +187,7 @@ class WorkspaceService(SoftDeleteService[Workspace]):
             List[Account]: List of accounts the user has access to through memberships
         """
         query = (
-            self.db.query(Workspace)
-            .join(Membership, Workspace.id == Membership.workspace_id)
-            .filter(
-                Membership.user_id == user_id,
-            )
+            self.get_workspaces_by_user_memberships_query(user_id)
             .offset(skip)
             .limit(limit)
         )
@@ -77,8 +203,11 @@ class WorkspaceService(SoftDeleteService[Workspace]):
         Returns:
             Query: SQLAlchemy query for workspaces the user has access to through memberships
         """
+        # The creator is part of every serialized workspace; load it with the
+        # page instead of once per workspace
         return (
             self.db.query(Workspace)
+            .options(joinedload(Workspace.created_by))
             .join(Membership, Workspace.id == Membership.workspace_id)
             .filter(
                 Membership.user_id == user_id,
@@ -89,7 +218,7 @@ class WorkspaceService(SoftDeleteService[Workspace]):
         return self.db.query(Workspace).offset(skip).limit(limit).all()
 
     def create_workspace(self, workspace: WorkspaceCreate) -> Workspace:
-        db_workspace = Workspace(**workspace.model_dump())
+        db_workspace = Workspace(**row_values(workspace))
         self.db.add(db_workspace)
         self.db.commit()
         self.db.refresh(db_workspace)
@@ -98,16 +227,7 @@ class WorkspaceService(SoftDeleteService[Workspace]):
     def update_workspace(
         self, workspace_id: UUID, workspace: WorkspaceUpdate
     ) -> Optional[Workspace]:
-        db_workspace = (
-            self.db.query(Workspace).filter(Workspace.id == workspace_id).first()
-        )
-        if db_workspace:
-            update_data = workspace.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(db_workspace, key, value)
-            self.db.commit()
-            self.db.refresh(db_workspace)
-        return db_workspace
+        return self.update_record(workspace_id, changed_values(workspace))
 
     def delete_workspace(self, workspace_id: UUID) -> bool:
         """Soft delete a workspace after pruning its resources."""
@@ -123,8 +243,8 @@ class WorkspaceService(SoftDeleteService[Workspace]):
         if not self.prune_service.prune_workspace(workspace_id):
             return False
 
-        # Then soft delete the workspace
-        return self.delete_record(workspace_id)
+        # Then soft delete the already loaded workspace
+        return self.soft_delete(workspace)
 
     def search(self, filters: Dict[str, Any]) -> List[Workspace]:
         """
@@ -152,142 +272,189 @@ class WorkspaceService(SoftDeleteService[Workspace]):
 
     def get_workspace_stats(self, workspace_id: UUID) -> Optional[WorkspaceStats]:
         """
-        Get comprehensive statistics for a workspace with optimized queries.
+        Get comprehensive statistics for a workspace in a single round-trip.
+
+        Every count and recent-items list is computed by a correlated
+        sub-select of one statement anchored on the workspace row, so the
+        whole dashboard costs one query instead of one per metric. Results
+        are cached for ``STATS_CACHE_TTL`` seconds and invalidated whenever
+        the workspace's projects, prompts, plugins or credentials change.
 
         Returns:
             WorkspaceStats: Statistics for the workspace or None if workspace doesn't exist
         """
-        # First verify the workspace exists
-        workspace = self.get_workspace(workspace_id)
-        if not workspace:
-            return None
+        cached = _read_cached_stats(workspace_id, _ALL_USERS_FIELD)
+        if cached is not None:
+            return cached
 
-        # Count total projects
-        total_projects = (
-            self.db.query(func.count(Project.id))
-            .filter(Project.workspace_id == workspace_id)
-            .scalar()
-        )
+        stats = self._build_stats(workspace_id, Project.workspace_id == workspace_id)
+        if stats is not None:
+            _write_cached_stats(workspace_id, _ALL_USERS_FIELD, stats)
+        return stats
 
-        # Count total prompts
-        total_prompts = (
-            self.db.query(func.count(Prompt.id))
-            .filter(Prompt.workspace_id == workspace_id)
-            .scalar()
-        )
-
-        # Get 5 most recently updated projects
-        recent_projects_query = (
-            self.db.query(Project)
-            .filter(Project.workspace_id == workspace_id)
-            .order_by(desc(Project.updated_at))
-            .limit(5)
-        )
-        recent_projects = [
-            ProjectSummary(
-                id=cast(UUID, p.id),
-                name=cast(str, p.name),
-                description=cast(Optional[str], p.description),
-                updated_at=cast(datetime, p.updated_at),
-            )
-            for p in recent_projects_query.all()
-        ]
+    def _build_stats(
+        self, workspace_id: UUID, project_criterion: Any
+    ) -> Optional[WorkspaceStats]:
+        """
+        Compute workspace statistics with one statement.
 
-        # Get 5 most recently updated prompts
-        recent_prompts_query = (
-            self.db.query(Prompt)
-            .filter(Prompt.workspace_id == workspace_id)
-            .order_by(desc(Prompt.updated_at))
-            .limit(5)
-        )
-        recent_prompts = [
-            PromptSummary(
-                id=cast(UUID, p.id),
-                name=cast(str, p.name),
-                type=cast(str, p.type),
-                updated_at=cast(datetime, p.updated_at),
-            )
-            for p in recent_prompts_query.all()
-        ]
+        Shared by the unfiltered and per-user variants, which differ only in
+        the projects they report; prompts, plugins and credentials are
+        always counted at the workspace level.
 
-        # Get plugin statistics (enabled vs disabled)
-        # Consider RUNNING, IDLE, and STARTING as enabled
-        # Consider STOPPED, ERROR, REGISTERED as disabled
-        enabled_states = [PluginState.RUNNING, PluginState.IDLE, PluginState.STARTING]
-        disabled_states = [
-            PluginState.STOPPED,
-            PluginState.ERROR,
-            PluginState.REGISTERED,
-            PluginState.INITIALIZING,
-        ]
+        Args:
+            workspace_id: The UUID of the workspace.
+            project_criterion: The filter selecting the projects to report.
 
-        plugin_stats_query = (
-            self.db.query(
-                func.count(case((Plugin.state.in_(enabled_states), 1))).label(
-                    "enabled"
-                ),
-                func.count(case((Plugin.state.in_(disabled_states), 1))).label(
-                    "disabled"
+        Returns:
+            Optional[WorkspaceStats]: The statistics, or None if the workspace doesn't exist.
+        """
+        row = self.db.execute(
+            select(
+                self._count_of(Project, project_criterion).label("total_projects"),
+                self._count_of(Prompt, Prompt.workspace_id == workspace_id).label(
+                    "total_prompts"
                 ),
+                self._count_of(
+                    Credential, Credential.workspace_id == workspace_id
+                ).label("total_credentials"),
+                self._plugin_state_counts(workspace_id).label("plugin_state_counts"),
+                *self._recent_lists(project_criterion, workspace_id),
             )
-            .filter(Plugin.workspace_id == workspace_id)
-            .first()
-        )
+            .select_from(Workspace)
+            .where(Workspace.id == workspace_id)
+        ).one_or_none()
 
-        plugin_stats = PluginStats(
-            total_enabled=(plugin_stats_query.enabled if plugin_stats_query else 0)
-            or 0,
-            total_disabled=(plugin_stats_query.disabled if plugin_stats_query else 0)
-            or 0,
-        )
+        if row is None:
+            return None
 
-        # Count total credentials
-        total_credentials = (
-            self.db.query(func.count(Credential.id))
-            .filter(Credential.workspace_id == workspace_id)
-            .scalar()
+        return WorkspaceStats(
+            project_stats=ProjectStats(
+                total_projects=row.total_projects or 0,
+                recent_projects=[
+                    ProjectSummary(**p) for p in row.recent_projects or []
+                ],
+            ),
+            prompt_stats=PromptStats(
+                total_prompts=row.total_prompts or 0,
+                recent_prompts=[PromptSummary(**p) for p in row.recent_prompts or []],
+            ),
+            plugin_stats=self._plugin_stats(row.plugin_state_counts),
+            credential_stats=CredentialStats(
+                total_credentials=row.total_credentials or 0,
+                recent_credentials=[
+                    CredentialSummary(**c) for c in row.recent_credentials or []
+                ],
+            ),
         )
 
-        # Get 5 most recently updated credentials
-        recent_credentials_query = (
-            self.db.query(Credential)
-            .filter(Credential.workspace_id == workspace_id)
-            .order_by(desc(Credential.updated_at))
-            .limit(5)
+    @staticmethod
+    def _count_of(model: Any, criterion: Any) -> Any:
+        """Build a scalar ``COUNT(*)`` sub-select of a model's rows matching a filter."""
+        return (
+            select(func.count()).select_from(model).where(criterion).scalar_subquery()
         )
-        recent_credentials = [
-            CredentialSummary(
-                id=cast(UUID, c.id),
-                name=cast(str, c.name),
-                type=cast(str, c.type),
-                updated_at=cast(datetime, c.updated_at),
-            )
-            for c in recent_credentials_query.all()
-        ]
 
-        credential_stats = CredentialStats(
-            total_credentials=total_credentials or 0,
-            recent_credentials=recent_credentials,
-        )
+    @staticmethod
+    def _plugin_state_counts(workspace_id: UUID) -> Any:
+        """
+        Build a scalar sub-select counting a workspace's plugins per state.
 
-        # Create project stats
-        project_stats = ProjectStats(
-            total_projects=total_projects or 0,
-            recent_projects=recent_projects,
-        )
+        A single ``GROUP BY state`` over the ``(workspace_id, state)`` partial
+        index; the per-state counts come back as one JSON object so they can
+        be bucketed client-side by :meth:`_plugin_stats`.
+
+        Args:
+            workspace_id: The UUID of the workspace.
 
-        # Create prompt stats
-        prompt_stats = PromptStats(
-            total_prompts=total_prompts or 0,
-            recent_prompts=recent_prompts,
+        Returns:
+            A scalar sub-select yielding a JSON object mapping state to count.
+        """
+        per_state = (
+            select(Plugin.state, func.count().label("total"))
+            .where(Plugin.workspace_id == workspace_id)
+            .group_by(Plugin.state)
+            .subquery()
+        )
+        return select(
+            func.json_object_agg(per_state.c.state, per_state.c.total)
+        ).scalar_subquery()
+
+    @staticmethod
+    def _plugin_stats(state_counts: Optional[Dict[str, int]]) -> PluginStats:
+        """Bucket per-state plugin counts into enabled and disabled totals."""
+        counts = {PluginState[state]: n for state, n in (state_counts or {}).items()}
+        return PluginStats(
+            total_enabled=sum(
+                n for state, n in counts.items() if state in ENABLED_PLUGIN_STATES
+            ),
+            total_disabled=sum(
+                n for state, n in counts.items() if state in DISABLED_PLUGIN_STATES
+            ),
         )
 
-        return WorkspaceStats(
-            project_stats=project_stats,
-            prompt_stats=prompt_stats,
-            plugin_stats=plugin_stats,
-            credential_stats=credential_stats,
+    @classmethod
+    def _recent_lists(cls, project_criterion: Any, workspace_id: UUID) -> List[Any]:
+        """
+        Build labelled sub-selects for the recent projects, prompts and credentials.
+
+        All three lists are fetched by the same statement; projects are
+        narrowed by ``project_criterion`` while prompts and credentials are
+        scoped to the workspace.
+
+        Args:
+            project_criterion: The filter selecting the projects to report.
+            workspace_id: The UUID of the workspace.
+
+        Returns:
+            The ``recent_projects``, ``recent_prompts`` and ``recent_credentials`` columns.
+        """
+        return [
+            cls._recent_json(
+                Project, project_criterion, Project.name, Project.description
+            ).label("recent_projects"),
+            cls._recent_json(
+                Prompt, Prompt.workspace_id == workspace_id, Prompt.name, Prompt.type
+            ).label("recent_prompts"),
+            cls._recent_json(
+                Credential,
+                Credential.workspace_id == workspace_id,
+                Credential.name,
+                Credential.type,
+            ).label("recent_credentials"),
+        ]
+
+    @staticmethod
+    def _recent_json(model: Any, criterion: Any, *columns: Any, limit: int = 5) -> Any:
+        """
+        Build a scalar sub-select returning the most recently updated rows as JSON.
+
+        Args:
+            model: The model to read from.
+            criterion: The filter selecting candidate rows.
+            *columns: Extra columns to include next to ``id`` and ``updated_at``.
+            limit: Maximum number of rows to include.
+
+        Returns:
+            A scalar sub-select yielding a JSON array of objects keyed by column name.
+        """
+        recent = (
+            select(model.id, model.updated_at, *columns)
+            .where(criterion)
+            .order_by(desc(model.updated_at))
+            .limit(limit)
+            .subquery()
         )
+        fields = []
+        for column in recent.c:
+            fields.extend((column.key, column))
+        return select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(*fields), desc(recent.c.updated_at)
+                )
+            )
+        ).scalar_subquery()
 
     def get_workspace_stats_for_user(
         self, workspace_id: UUID, user_id: UUID
@@ -295,123 +462,20 @@ class WorkspaceService(SoftDeleteService[Workspace]):
         """
         Get workspace statistics filtered by the requesting user's accessible projects.
         Other stats (prompts, plugins, credentials) are counted at the workspace level.
+        Results are cached per user like ``get_workspace_stats``; membership
+        changes invalidate them too.
         """
-        # Verify workspace exists
-        workspace = self.get_workspace(workspace_id)
-        if not workspace:
-            return None
+        cached = _read_cached_stats(workspace_id, str(user_id))
+        if cached is not None:
+            return cached
 
-        membership_service = MembershipService(self.db)
-        accessible_projects = membership_service.get_accessible_projects_for_user(
+        # Project stats filtered by access; the user's role is looked up by
+        # the same statement, so per-user stats also cost one round-trip
+        project_criterion = MembershipService.accessible_projects_criterion(
             workspace_id, user_id
         )
-        accessible_project_ids = [p.id for p in accessible_projects]
-
-        # Project stats filtered by access
-        total_projects = len(accessible_project_ids)
-        if total_projects == 0:
-            recent_projects = []
-        else:
-            recent_projects_query = (
-                self.db.query(Project)
-                .filter(Project.id.in_(accessible_project_ids))
-                .order_by(desc(Project.updated_at))
-                .limit(5)
-            )
-            recent_projects = [
-                ProjectSummary(
-                    id=cast(UUID, p.id),
-                    name=cast(str, p.name),
-                    description=cast(Optional[str], p.description),
-                    updated_at=cast(datetime, p.updated_at),
-                )
-                for p in recent_projects_query.all()
-            ]
-
-        # Reuse remaining stats from unfiltered helper path
-        total_prompts = (
-            self.db.query(func.count(Prompt.id))
-            .filter(Prompt.workspace_id == workspace_id)
-            .scalar()
-        )
-
-        recent_prompts_query = (
-            self.db.query(Prompt)
-            .filter(Prompt.workspace_id == workspace_id)
-            .order_by(desc(Prompt.updated_at))
-            .limit(5)
-        )
-        recent_prompts = [
-            PromptSummary(
-                id=cast(UUID, p.id),
-                name=cast(str, p.name),
-                type=cast(str, p.type),
-                updated_at=cast(datetime, p.updated_at),
-            )
-            for p in recent_prompts_query.all()
-        ]
-
-        enabled_states = [PluginState.RUNNING, PluginState.IDLE, PluginState.STARTING]
-        disabled_states = [
-            PluginState.STOPPED,
-            PluginState.ERROR,
-            PluginState.REGISTERED,
-            PluginState.INITIALIZING,
-        ]
-        plugin_stats_query = (
-            self.db.query(
-                func.count(case((Plugin.state.in_(enabled_states), 1))).label(
-                    "enabled"
-                ),
-                func.count(case((Plugin.state.in_(disabled_states), 1))).label(
-                    "disabled"
-                ),
-            )
-            .filter(Plugin.workspace_id == workspace_id)
-            .first()
-        )
-        plugin_stats = PluginStats(
-            total_enabled=(plugin_stats_query.enabled if plugin_stats_query else 0)
-            or 0,
-            total_disabled=(plugin_stats_query.disabled if plugin_stats_query else 0)
-            or 0,
-        )
-
-        total_credentials = (
-            self.db.query(func.count(Credential.id))
-            .filter(Credential.workspace_id == workspace_id)
-            .scalar()
-        )
-        recent_credentials_query = (
-            self.db.query(Credential)
-            .filter(Credential.workspace_id == workspace_id)
-            .order_by(desc(Credential.updated_at))
-            .limit(5)
-        )
-        recent_credentials = [
-            CredentialSummary(
-                id=cast(UUID, c.id),
-                name=cast(str, c.name),
-                type=cast(str, c.type),
-                updated_at=cast(datetime, c.updated_at),
-            )
-            for c in recent_credentials_query.all()
-        ]
 
-        project_stats = ProjectStats(
-            total_projects=total_projects or 0, recent_projects=recent_projects
-        )
-        prompt_stats = PromptStats(
-            total_prompts=total_prompts or 0, recent_prompts=recent_prompts
-        )
-        credential_stats = CredentialStats(
-            total_credentials=total_credentials or 0,
-            recent_credentials=recent_credentials,
-        )
-
-        return WorkspaceStats(
-            project_stats=project_stats,
-            prompt_stats=prompt_stats,
-            plugin_stats=plugin_stats,
-            credential_stats=credential_stats,
-        )
+        stats = self._build_stats(workspace_id, project_criterion)
+        if stats is not None:
+            _write_cached_stats(workspace_id, str(user_id), stats)
+        return stats
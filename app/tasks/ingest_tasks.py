@@ -1,16 +1,92 @@
-from typing import Dict, Optional
-from uuid import UUID
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID, uuid4
+
+from celery import chord
+from llama_index.core.schema import Document
+from sqlalchemy import inspect, text as sql_text
+from sqlalchemy.orm import Session
 
 from app.core.celery_app import celery_app
 from app.core.index_manager import IndexManager
 from app.core.ingestor import Ingestor
 from app.core.storage_manager import StorageManager
-from app.db import SessionLocal
 from app.exceptions.resource_not_found_error import ResourceNotFoundError
 from app.models.project import Project
 from app.services.project_service import ProjectService
+from app.utils.cache import ingest_chunks_cache
 from app.utils.db.db_session_helper import db_session
 
+# Chunks handed to each ingestion subtask: large enough that embeddings and
+# vector-store inserts go out in batches, small enough to spread a large
+# document across the worker pool.
+CHUNKS_PER_SUBTASK = 32
+
+# How long staged chunk batches wait in Redis for their subtask; generous so a
+# backed-up queue doesn't expire them.
+STAGED_CHUNKS_TTL = 24 * 60 * 60
+
+
+def _get_project(db: Session, project_id: str) -> Project:
+    project = ProjectService(db).get_project(UUID(project_id))
+    if project is None:
+        raise ResourceNotFoundError(f"Project with id {project_id} not found")
+    return project
+
+
+@contextmanager
+def _project_ingestor(project_id: str) -> Iterator[Ingestor]:
+    """
+    Build an ingestor for a project's vector store.
+
+    The project is only needed to configure the embedding model and vector
+    store, so it is read in its own short-lived session. PGVectorStore opens
+    an engine and pool of its own, so the pool is disposed once the caller is
+    done instead of being left open for the lifetime of the worker.
+    """
+    with db_session() as db:
+        project = _get_project(db, project_id)
+
+        # Extract all needed project data before closing the session
+        # to avoid lazy loading issues
+        embedding_model = IndexManager.embedding_model_from_project(project)
+        vector_store = StorageManager().vector_store(project)
+
+    try:
+        yield Ingestor(embedding_model, vector_store)
+    finally:
+        # client is only set once the store has connected
+        if vector_store.client is not None:
+            vector_store.client.dispose()
+
+
+def _delete_chunks(project_id: str, ref_id: str, version: str, stale: bool) -> None:
+    """
+    Delete a document's chunks from the project's vector index table.
+
+    Args:
+        project_id: ID of the project holding the document.
+        ref_id: Reference identifier for the document.
+        version: Identifier of an ingestion run.
+        stale: If True, delete every chunk *not* written by ``version``;
+            otherwise delete only the chunks written by ``version``.
+    """
+    with db_session() as db:
+        table_name = _get_project(db, project_id).vector_llama_index_name()
+        # The table only exists once a chunk has been stored for the project
+        if not inspect(db.get_bind()).has_table(table_name):
+            return
+
+        version_match = "NOT starts_with" if stale else "starts_with"
+        db.execute(
+            sql_text(
+                f"DELETE FROM {table_name} "
+                "WHERE metadata_->>'ref_doc_id' = :ref_id "
+                f"AND {version_match}(node_id, :prefix)"
+            ),
+            {"ref_id": ref_id, "prefix": Ingestor.chunk_id_prefix(ref_id, version)},
+        )
+
 
 @celery_app.task
 def ingest_project_text(
@@ -22,22 +98,121 @@ def ingest_project_text(
     """
     Background task to ingest raw text into a project's vector store.
 
+    The text is split into chunks up front and each run of
+    ``CHUNKS_PER_SUBTASK`` chunks is embedded and stored by its own subtask,
+    so a large document is spread across the worker pool instead of
+    blocking a single worker.
+
+    The chunks are stored as a new version next to the previous version of
+    the document, which is only removed once every chunk has been stored. If
+    any subtask fails, the partial new version is removed instead.
+
     Args:
         project_id: ID of the project receiving the text.
         ref_id: Reference identifier for the text.
         text: The textual content to ingest.
         labels: Optional metadata labels to attach to the ingested text.
     """
-    with db_session() as db:
-        project = ProjectService(db).get_project(UUID(project_id))
-        if project is None:
-            raise ResourceNotFoundError(f"Project with id {project_id} not found")
+    version = uuid4().hex
+    chunks = Ingestor.split_raw_text(text)
+    document_hash = Document(text=text, id_=ref_id, metadata=labels).hash
 
-        # Extract all needed project data before closing the session
-        # to avoid lazy loading issues
-        storage_manager = StorageManager()
-        ingestor = Ingestor(
-            IndexManager.embedding_model_from_project(project),
-            storage_manager.vector_store(project),
+    # Stage the batches in Redis so subtask messages carry ids, not text
+    batch_starts = range(0, len(chunks), CHUNKS_PER_SUBTASK)
+    for start in batch_starts:
+        staged = ingest_chunks_cache.write_field(
+            version,
+            str(start),
+            chunks[start : start + CHUNKS_PER_SUBTASK],
+            ttl=STAGED_CHUNKS_TTL,
         )
-        ingestor.ingest_raw_text(ref_id, text, labels)
+        if not staged:
+            raise RuntimeError(f"Could not stage the chunks of {ref_id} in Redis")
+
+    finalize = finalize_text_ingest.s(project_id, ref_id, version, document_hash)
+    chord(
+        [
+            ingest_text_chunks.si(project_id, ref_id, version, start, labels)
+            for start in batch_starts
+        ]
+    )(finalize.on_error(discard_text_ingest.si(project_id, ref_id, version)))
+
+
+@celery_app.task
+def ingest_text_chunks(
+    project_id: str,
+    ref_id: str,
+    version: str,
+    first_chunk_idx: int,
+    labels: Optional[Dict[str, str]] = None,
+) -> int:
+    """
+    Embed and store a staged batch of chunks of a document.
+
+    Args:
+        project_id: ID of the project receiving the text.
+        ref_id: Reference identifier for the document.
+        version: Identifier of the ingestion run that staged the batch.
+        first_chunk_idx: Position of the batch's first chunk within the document.
+        labels: Optional metadata labels to attach to the chunks.
+
+    Returns:
+        int: The number of chunks stored.
+    """
+    texts = ingest_chunks_cache.read_field(version, str(first_chunk_idx))
+    if texts is None:
+        raise RuntimeError(
+            f"Chunks {first_chunk_idx}+ of {ref_id} are no longer staged in Redis"
+        )
+
+    with _project_ingestor(project_id) as ingestor:
+        ingestor.ingest_chunks(ref_id, version, first_chunk_idx, texts, labels)
+    return len(texts)
+
+
+@celery_app.task
+def finalize_text_ingest(
+    chunk_counts: List[int],
+    project_id: str,
+    ref_id: str,
+    version: str,
+    document_hash: str,
+) -> int:
+    """
+    Swap in a document's new version once every chunk subtask has finished.
+
+    Records the document hash, then removes the chunks of any previous
+    version in a single statement.
+
+    Args:
+        chunk_counts: Number of chunks stored by each chunk subtask.
+        project_id: ID of the project receiving the text.
+        ref_id: Reference identifier for the document.
+        version: Identifier of the ingestion run being finalized.
+        document_hash: Hash of the ingested document.
+
+    Returns:
+        int: The number of chunks stored.
+    """
+    StorageManager().get_docstore().set_document_hash(ref_id, document_hash)
+    _delete_chunks(project_id, ref_id, version, stale=True)
+    ingest_chunks_cache.delete(version)
+    return sum(chunk_counts)
+
+
+@celery_app.task
+def discard_text_ingest(project_id: str, ref_id: str, version: str) -> None:
+    """
+    Remove the chunks stored by a failed ingestion run.
+
+    Attached as the error callback of ``finalize_text_ingest``, so it runs
+    when a chunk subtask fails and the previous version of the document is
+    left in place.
+
+    Args:
+        project_id: ID of the project receiving the text.
+        ref_id: Reference identifier for the document.
+        version: Identifier of the failed ingestion run.
+    """
+    _delete_chunks(project_id, ref_id, version, stale=False)
+    ingest_chunks_cache.delete(version)
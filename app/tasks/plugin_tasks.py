@@ -1,13 +1,67 @@
 import asyncio
+from typing import Any, Coroutine, Optional, TypeVar
 from uuid import UUID
 
+from celery.signals import worker_process_shutdown
+
 from app.core.plugin_manager.manager import PluginManager
 from app.constants.plugin_states import PluginState
-from app.db import SessionLocal
 from app.services.plugin_service import PluginService
 from app.core.celery_app import celery_app
 from app.utils.db.db_session_helper import db_session
 
+# One event loop per worker process, reused by every task it runs
+_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return this process's event loop, creating it on first use.
+
+    Created lazily so a prefork worker builds its own loop after forking
+    rather than inheriting the parent's, and reused so each task skips the
+    loop setup and teardown ``asyncio.run`` pays.
+    """
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+    return _loop
+
+
+T = TypeVar("T")
+
+
+def _run(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion on this process's event loop.
+
+    Tasks the coroutine spawned but didn't await are cancelled afterwards so
+    they can't pile up on the shared loop between Celery tasks.
+    """
+    loop = _event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        pending = asyncio.all_tasks(loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+@worker_process_shutdown.connect
+def close_event_loop(**_kwargs) -> None:
+    """Finalize async generators and close the loop when the process exits."""
+    global _loop
+    if _loop is None or _loop.is_closed():
+        return
+    try:
+        _loop.run_until_complete(_loop.shutdown_asyncgens())
+        _loop.run_until_complete(_loop.shutdown_default_executor())
+    finally:
+        _loop.close()
+        _loop = None
+
 
 @celery_app.task
 def inspect_plugin(plugin_id: str, access_token: str) -> None:
@@ -15,14 +69,15 @@ def inspect_plugin(plugin_id: str, access_token: str) -> None:
     Inspect a plugin by listing its tools, prompts, and resources.
     This is an async task that runs in the background.
     """
+    # Parsed once; str() keeps eager runs working, where the id arrives as a UUID
+    plugin_uuid = UUID(str(plugin_id))
+
     with db_session() as db:
-        plugin_manager = PluginManager(
-            db, UUID(str(plugin_id)), access_token=access_token
-        )
+        plugin_manager = PluginManager(db, plugin_uuid, access_token=access_token)
         plugin_service = PluginService(db)
 
         try:
-            asyncio.run(plugin_manager.refresh())
+            _run(plugin_manager.refresh())
         except Exception as e:
-            plugin_service.update_state(UUID(str(plugin_id)), PluginState.ERROR)
+            plugin_service.update_state(plugin_uuid, PluginState.ERROR)
             raise RuntimeError(f"Failed to initialize plugin: {str(e)}")
@@ -6,7 +6,10 @@ import requests  # For making HTTP requests
 from fastapi import HTTPException, status, Request
 from fastapi.security import HTTPBearer
 
+from opentelemetry import trace
+
 from app.config import get_settings
+from app.core.telemetry import instrument_method
 from app.services.user_service import UserService
 
 security = HTTPBearer()
@@ -62,6 +65,7 @@ class VerifyToken:
         jwks_url = f"https://{self.config.oidc_domain}/.well-known/jwks.json"
         self.jwks_client = jwt.PyJWKClient(jwks_url, cache_keys=True)
 
+    @instrument_method("auth.verify")
     def verify(self, token: str):
         # Check if token is None or empty
         if not token:
@@ -90,11 +94,12 @@ class VerifyToken:
                 audience=self.config.oidc_api_audience,
                 issuer=self.config.oidc_issuer,
             )
-        except Exception as error:
-            raise UnauthorizedException(str(error))
+        except jwt.InvalidTokenError as error:
+            raise UnauthorizedException(str(error)) from None
 
         # Extract user ID from JWT payload
         external_user_id = payload["sub"]
+        trace.get_current_span().set_attribute("auth.sub", external_user_id)
 
         # User not in cache or cache was invalid, check database
         user = self.user_service.get_user_by_external_id(external_user_id)
@@ -108,6 +113,7 @@ class VerifyToken:
             user = self.handle_user_onboarding(payload, userinfo)
             return user
 
+    @instrument_method("auth.fetch_userinfo")
     def fetch_user_info_from_identies(self, access_token: str) -> dict:
         """Fetch user information from the oidc userinfo endpoint."""
         userinfo_url = f"{self.config.identies_host}/userinfo"
@@ -91,6 +91,77 @@ class Cache:
             logger.error(f"Error writing key {key} to cache: {e}")
             return False
 
+    def read_field(self, key: str, field: str) -> Optional[Any]:
+        """
+        Read one field of a hash entry from cache.
+
+        Args:
+            key: Cache key of the hash
+            field: Field within the hash
+
+        Returns:
+            Cached value if found, None otherwise
+        """
+        try:
+            cache_key = self._get_cache_key(key)
+            cached_value = self.redis_client.hget(cache_key, field)
+
+            if cached_value is not None:
+                logger.debug(f"Cache hit for key: {key}[{field}]")
+                return self._deserialize_value(cached_value)
+
+            logger.debug(f"Cache miss for key: {key}[{field}]")
+            return None
+
+        except ConnectionError as e:
+            logger.warning(
+                f"Redis connection error while reading key {key}[{field}]: {e}"
+            )
+            return None
+        except Exception as e:
+            logger.error(f"Error reading key {key}[{field}] from cache: {e}")
+            return None
+
+    def write_field(
+        self, key: str, field: str, value: Any, ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Write one field of a hash entry to cache.
+
+        Grouping related values under one hash lets ``delete(key)`` drop them
+        all at once. The TTL applies to the whole hash and is renewed on
+        every write.
+
+        Args:
+            key: Cache key of the hash
+            field: Field within the hash
+            value: Value to cache
+            ttl: Time to live in seconds (defaults to default_ttl)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            cache_key = self._get_cache_key(key)
+            serialized_value = self._serialize_value(value)
+            ttl = ttl or self.default_ttl
+
+            pipeline = self.redis_client.pipeline(transaction=False)
+            pipeline.hset(cache_key, field, serialized_value)
+            pipeline.expire(cache_key, ttl)
+            pipeline.execute()
+            logger.debug(f"Cached key {key}[{field}] with TTL {ttl}s")
+            return True
+
+        except ConnectionError as e:
+            logger.warning(
+                f"Redis connection error while writing key {key}[{field}]: {e}"
+            )
+            return False
+        except Exception as e:
+            logger.error(f"Error writing key {key}[{field}] to cache: {e}")
+            return False
+
     def delete(self, key: str) -> bool:
         """
         Delete value from cache.
@@ -233,3 +304,5 @@ def create_cache(namespace: str = "cache") -> Cache:
 user_cache = Cache("user")
 workspace_cache = Cache("workspace")
 project_cache = Cache("project")
+workspace_stats_cache = Cache("workspace_stats")
+ingest_chunks_cache = Cache("ingest_chunks")
@@ -1,8 +1,9 @@
+from functools import lru_cache
 from typing import Any, Dict, Callable
+from sqlalchemy import inspect
 from sqlalchemy.orm import Query
 from sqlalchemy.sql import ColumnElement
 
-
 # Supported operators
 OPERATORS: Dict[str, Callable[[ColumnElement, Any], ColumnElement]] = {
     "==": lambda col, val: col == val,
@@ -19,6 +20,17 @@ OPERATORS: Dict[str, Callable[[ColumnElement, Any], ColumnElement]] = {
 }
 
 
+@lru_cache(maxsize=None)
+def _filterable_columns(model: Any) -> Dict[str, Any]:
+    """
+    Map each column attribute name of a model to its instrumented attribute.
+
+    Built once per model so filtering does not re-introspect the mapper on
+    every call; only column attributes are filterable.
+    """
+    return {attr.key: getattr(model, attr.key) for attr in inspect(model).column_attrs}
+
+
 def apply_filters(query: Query, model: Any, filters: Dict[str, Any]) -> Query:
     """
     Dynamically applies SQLAlchemy filters to a query based on a dictionary input.
@@ -51,8 +63,10 @@ def apply_filters(query: Query, model: Any, filters: Dict[str, Any]) -> Query:
         filtered_query = apply_filters(query, User, filters)
         users = filtered_query.all()
     """
+    columns = _filterable_columns(model)
+    criteria = []
     for field, condition in filters.items():
-        column = getattr(model, field, None)
+        column = columns.get(field)
         if column is None:
             continue  # Skip invalid fields silently; or raise ValueError for stricter behavior
 
@@ -62,12 +76,13 @@ def apply_filters(query: Query, model: Any, filters: Dict[str, Any]) -> Query:
             value = condition.get("value")
             op_func = OPERATORS.get(operator)
             if op_func:
-                query = query.filter(op_func(column, value))
+                criteria.append(op_func(column, value))
             else:
                 # Fall back to equality if unknown operator
-                query = query.filter(column == value)
+                criteria.append(column == value)
         else:
             # Simple equality
-            query = query.filter(column == condition)
+            criteria.append(column == condition)
 
-    return query
+    # A single filter() call clones the query once instead of once per field
+    return query.filter(*criteria) if criteria else query
@@ -0,0 +1,35 @@
+from typing import Any, Dict
+from pydantic import BaseModel
+
+
+def row_values(schema: BaseModel) -> Dict[str, Any]:
+    """
+    Return a schema's field values as a plain dict for building model rows.
+
+    Equivalent to ``schema.model_dump()`` for flat schemas (scalar fields, no
+    custom serializers), but copies the instance dict instead of walking the
+    serializer for every write.
+
+    Args:
+        schema (BaseModel): The validated create/update schema.
+
+    Returns:
+        Dict[str, Any]: Field names mapped to their values.
+    """
+    return dict(schema.__dict__)
+
+
+def changed_values(schema: BaseModel) -> Dict[str, Any]:
+    """
+    Return only the fields explicitly set on a schema.
+
+    Equivalent to ``schema.model_dump(exclude_unset=True)`` for flat schemas.
+
+    Args:
+        schema (BaseModel): The validated update schema.
+
+    Returns:
+        Dict[str, Any]: The explicitly set field names mapped to their values.
+    """
+    values = schema.__dict__
+    return {field: values[field] for field in schema.model_fields_set}
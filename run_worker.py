@@ -18,15 +18,24 @@ The final worker command is constructed dynamically and passed
 to Celery via `worker_main()`.
 """
 
+import logging
 import os
 import sys
 import socket
 
-from app.core.celery_app import celery_app
+logger = logging.getLogger(__name__)
 
 
 def main():
+    # Imported here so loading this module doesn't pull in the app, its
+    # settings and its database engine.
+    from app.config import get_settings
+    from app.core.celery_app import celery_app
+
     loglevel = os.getenv("CELERY_LOGLEVEL", "info")
+    # Celery sets up its own logging in worker_main(); until then, make sure
+    # the startup summary below is printed at the worker's log level.
+    logging.basicConfig(level=loglevel.upper())
     # Determine Celery worker pool implementation.
     # - "prefork" (default on Linux): creates multiple OS processes equal to concurrency.
     # - "solo" (used on macOS): runs everything in a single process; safer for local dev.
@@ -41,6 +50,22 @@ def main():
     #   concurrency has no impact on DB connections (only one process exists).
     concurrency = os.getenv("CELERY_CONCURRENCY", "1" if pool == "solo" else "4")
     queues = os.getenv("CELERY_QUEUES", "quore")  # Default to chrona queue
+    # Tasks are long-running (plugin inspection, ingestion), so each process
+    # reserves one task at a time instead of hoarding a batch.
+    prefetch_multiplier = os.getenv("CELERY_PREFETCH_MULTIPLIER", "1")
+
+    # Log the connection budget so an oversized concurrency is caught early.
+    settings = get_settings()
+    processes = int(concurrency) if pool == "prefork" else 1
+    per_process = settings.database_pool_size + settings.database_max_overflow
+    logger.info(
+        "Celery worker: %s process(es) x (pool_size %s + max_overflow %s) "
+        "= up to %s database connections",
+        processes,
+        settings.database_pool_size,
+        settings.database_max_overflow,
+        processes * per_process,
+    )
 
     # Generate a unique worker node name so that multiple workers can run without collisions.
     hostname = socket.gethostname()
@@ -53,6 +78,7 @@ def main():
         f"--loglevel={loglevel}",
         f"--pool={pool}",
         f"--concurrency={concurrency}",
+        f"--prefetch-multiplier={prefetch_multiplier}",
         f"--queues={queues}",  # Always specify queues
         f"--hostname={nodename}",  # Unique node name to avoid duplicate warnings
     ]
@@ -4,7 +4,6 @@ from datetime import datetime, timedelta, timezone
 
 from app.commands.invitations.decline_invitation_command import DeclineInvitationCommand
 from app.models.invitation import Invitation
-from app.constants.membership import MembershipRoles
 from app.exceptions.invitation_exceptions import (
     InvitationExpiredError,
     InvitationNotFoundError,
@@ -31,7 +30,7 @@ class TestDeclineInvitationCommand:
         deleted_invitation = InvitationService(db).get_invitation(invitation.id)
         assert deleted_invitation is None
 
-    def test_decline_invitation_not_found(self, db, faker):
+    def test_decline_invitation_not_found(self, db):
         """Test declining a non-existent invitation."""
         non_existent_id = uuid4()
 
@@ -43,23 +42,12 @@ class TestDeclineInvitationCommand:
         ):
             command.execute(non_existent_id, "test@example.com")
 
-    def test_decline_expired_invitation(self, db, setup_workspace, setup_user, faker):
+    def test_decline_expired_invitation(self, db, invitation_factory):
         """Test declining an expired invitation."""
-        # Create inviter user
-        inviter = setup_user
-
-        # Create expired invitation
-        invitation = Invitation(
-            id=uuid4(),
+        invitation = invitation_factory(
             email="test@example.com",
-            workspace_id=setup_workspace.id,
-            inviter_id=inviter.id,
-            role=MembershipRoles.COLLABORATOR,
             expires_at=datetime.now(timezone.utc) - timedelta(hours=1),  # Expired
-            message="Test invitation",
         )
-        db.add(invitation)
-        db.commit()
 
         # Execute command
         command = DeclineInvitationCommand(db)
@@ -73,25 +61,9 @@ class TestDeclineInvitationCommand:
         )
         assert existing_invitation is not None
 
-    def test_decline_invitation_wrong_user(
-        self, db, setup_workspace, setup_user, faker
-    ):
+    def test_decline_invitation_wrong_user(self, db, invitation_factory):
         """Test declining an invitation with wrong user email."""
-        # Create inviter user
-        inviter = setup_user
-
-        # Create invitation
-        invitation = Invitation(
-            id=uuid4(),
-            email="test@example.com",
-            workspace_id=setup_workspace.id,
-            inviter_id=inviter.id,
-            role=MembershipRoles.COLLABORATOR,
-            expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
-            message="Test invitation",
-        )
-        db.add(invitation)
-        db.commit()
+        invitation = invitation_factory(email="test@example.com")
 
         # Execute command with wrong email
         command = DeclineInvitationCommand(db)
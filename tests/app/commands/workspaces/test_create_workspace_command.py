@@ -1,3 +1,5 @@
+import pytest
+
 from app.commands.workspaces.create_workspace_command import CreateWorkspaceCommand
 from app.models.workspace import Workspace
 from app.models.membership import Membership
@@ -8,26 +10,46 @@ from app.constants.membership import OWNER_ROLE
 class TestCreateWorkspaceCommand:
     """Test cases for CreateWorkspaceCommand."""
 
-    def test_create_workspace_success(self, db, setup_user, faker):
-        """Test successfully creating a workspace with owner membership."""
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            {"description": "A workspace for testing"},
+            {},
+            {
+                "description": "A workspace for testing",
+                "identifier": "test-workspace-123",
+            },
+            {
+                "description": "A workspace for testing",
+                "logo": "https://example.com/logo.png",
+            },
+        ],
+        ids=[
+            "with_description",
+            "without_description",
+            "with_identifier",
+            "with_logo",
+        ],
+    )
+    def test_create_workspace(self, db, setup_user, faker, fields):
+        """Test creating a workspace stores the given fields and an owner membership."""
         # Arrange
         user = setup_user
         workspace_data = WorkspaceCreate(
-            name=faker.company(),
-            description=faker.text(100),
-            created_by_id=user.id,
+            name=faker.company(), created_by_id=user.id, **fields
         )
 
         # Act
         command = CreateWorkspaceCommand(db)
         workspace = command.execute(workspace_data)
 
-        # Assert workspace was created correctly
+        # Assert workspace was created correctly; optional fields left out stay unset
         assert workspace is not None
+        assert workspace.id is not None
         assert workspace.name == workspace_data.name
-        assert workspace.description == workspace_data.description
         assert workspace.created_by_id == user.id
-        assert workspace.id is not None
+        for field in ("description", "identifier", "logo"):
+            assert getattr(workspace, field) == fields.get(field)
 
         # Assert owner membership was created
         membership = (
@@ -43,103 +65,6 @@ class TestCreateWorkspaceCommand:
         assert membership.user_id == user.id
         assert membership.workspace_id == workspace.id
 
-    def test_create_workspace_without_description(self, db, setup_user, faker):
-        """Test creating a workspace without a description."""
-        # Arrange
-        user = setup_user
-        workspace_data = WorkspaceCreate(
-            name=faker.company(),
-            created_by_id=user.id,
-        )
-
-        # Act
-        command = CreateWorkspaceCommand(db)
-        workspace = command.execute(workspace_data)
-
-        # Assert workspace was created correctly
-        assert workspace is not None
-        assert workspace.name == workspace_data.name
-        assert workspace.description is None
-        assert workspace.created_by_id == user.id
-
-        # Assert owner membership was created
-        membership = (
-            db.query(Membership)
-            .filter(
-                Membership.user_id == user.id,
-                Membership.workspace_id == workspace.id,
-            )
-            .first()
-        )
-        assert membership is not None
-        assert membership.role == OWNER_ROLE
-
-    def test_create_workspace_with_identifier(self, db, setup_user, faker):
-        """Test creating a workspace with an identifier."""
-        # Arrange
-        user = setup_user
-        workspace_data = WorkspaceCreate(
-            name=faker.company(),
-            description=faker.text(100),
-            identifier="test-workspace-123",
-            created_by_id=user.id,
-        )
-
-        # Act
-        command = CreateWorkspaceCommand(db)
-        workspace = command.execute(workspace_data)
-
-        # Assert workspace was created correctly
-        assert workspace is not None
-        assert workspace.name == workspace_data.name
-        assert workspace.identifier == "test-workspace-123"
-        assert workspace.created_by_id == user.id
-
-        # Assert owner membership was created
-        membership = (
-            db.query(Membership)
-            .filter(
-                Membership.user_id == user.id,
-                Membership.workspace_id == workspace.id,
-            )
-            .first()
-        )
-        assert membership is not None
-        assert membership.role == OWNER_ROLE
-
-    def test_create_workspace_with_logo(self, db, setup_user, faker):
-        """Test creating a workspace with a logo URL."""
-        # Arrange
-        user = setup_user
-        workspace_data = WorkspaceCreate(
-            name=faker.company(),
-            description=faker.text(100),
-            logo="https://example.com/logo.png",
-            created_by_id=user.id,
-        )
-
-        # Act
-        command = CreateWorkspaceCommand(db)
-        workspace = command.execute(workspace_data)
-
-        # Assert workspace was created correctly
-        assert workspace is not None
-        assert workspace.name == workspace_data.name
-        assert workspace.logo == "https://example.com/logo.png"
-        assert workspace.created_by_id == user.id
-
-        # Assert owner membership was created
-        membership = (
-            db.query(Membership)
-            .filter(
-                Membership.user_id == user.id,
-                Membership.workspace_id == workspace.id,
-            )
-            .first()
-        )
-        assert membership is not None
-        assert membership.role == OWNER_ROLE
-
     def test_create_multiple_workspaces_same_user(self, db, setup_user, faker):
         """Test creating multiple workspaces for the same user."""
         # Arrange
@@ -274,36 +199,3 @@ class TestCreateWorkspaceCommand:
         )
         assert db_membership is not None
         assert db_membership.role == OWNER_ROLE
-
-    def test_create_workspace_with_minimal_data(self, db, setup_user, faker):
-        """Test creating a workspace with only the required fields."""
-        # Arrange
-        user = setup_user
-        workspace_data = WorkspaceCreate(
-            name="Minimal Workspace",
-            created_by_id=user.id,
-        )
-
-        # Act
-        command = CreateWorkspaceCommand(db)
-        workspace = command.execute(workspace_data)
-
-        # Assert workspace was created with minimal data
-        assert workspace is not None
-        assert workspace.name == "Minimal Workspace"
-        assert workspace.description is None
-        assert workspace.logo is None
-        assert workspace.identifier is None
-        assert workspace.created_by_id == user.id
-
-        # Assert owner membership was created
-        membership = (
-            db.query(Membership)
-            .filter(
-                Membership.user_id == user.id,
-                Membership.workspace_id == workspace.id,
-            )
-            .first()
-        )
-        assert membership is not None
-        assert membership.role == OWNER_ROLE
@@ -0,0 +1,21 @@
+from unittest.mock import patch
+
+from app.core.celery_app import close_db_pool, warm_db_pool
+
+
+def test_warm_db_pool_resets_inherited_pool_and_connects():
+    """Test a forked worker drops the parent's pool and opens a connection."""
+    with patch("app.db.engine") as engine:
+        warm_db_pool()
+
+    engine.dispose.assert_called_once_with(close=False)
+    engine.connect.assert_called_once_with()
+    engine.connect.return_value.__exit__.assert_called_once()
+
+
+def test_close_db_pool_disposes_engine():
+    """Test an exiting worker process closes its pooled connections."""
+    with patch("app.db.engine") as engine:
+        close_db_pool()
+
+    engine.dispose.assert_called_once_with()
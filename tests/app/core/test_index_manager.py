@@ -8,24 +8,18 @@ def test_index_manager_initialization(db, setup_project):
     project = setup_project
     index_manager = IndexManager(db, project)
 
+    expected = project.ingest_settings_obj()
+
     assert index_manager.project == project
     assert index_manager.db == db
-    assert (
-        index_manager.ingest_settings.data_dir == project.ingest_settings_obj().data_dir
-    )
-    assert index_manager.ingest_settings.hnsw_m == project.ingest_settings_obj().hnsw_m
+    assert index_manager.ingest_settings.data_dir == expected.data_dir
+    assert index_manager.ingest_settings.hnsw_m == expected.hnsw_m
     assert (
         index_manager.ingest_settings.hnsw_ef_construction
-        == project.ingest_settings_obj().hnsw_ef_construction
-    )
-    assert (
-        index_manager.ingest_settings.hnsw_ef_search
-        == project.ingest_settings_obj().hnsw_ef_search
-    )
-    assert (
-        index_manager.ingest_settings.hnsw_dist_method
-        == project.ingest_settings_obj().hnsw_dist_method
+        == expected.hnsw_ef_construction
     )
+    assert index_manager.ingest_settings.hnsw_ef_search == expected.hnsw_ef_search
+    assert index_manager.ingest_settings.hnsw_dist_method == expected.hnsw_dist_method
     assert index_manager.ingestor is not None
 
 
@@ -75,8 +69,8 @@ def test_drop_index(db, setup_project):
     # Drop the index
     index_manager.drop_index()
 
-    # Re-instantiate inspector to avoid caching
-    inspector = inspect(db.get_bind())
+    # has_table() results are cached on the inspector
+    inspector.clear_cache()
     # Verify the table no longer exists
     assert not inspector.has_table(project.vector_llama_index_name())
 
@@ -86,9 +80,6 @@ def test_create_query_engine(db, setup_project):
     project = setup_project
     index_manager = IndexManager(db, project)
 
-    # Create the index first
-    index_manager.create_index()
-
     # Create the query engine
     query_engine = index_manager.create_query_engine()
 
@@ -102,9 +93,6 @@ def test_get_query_engine_tool(db, setup_project):
     project = setup_project
     index_manager = IndexManager(db, project)
 
-    # Create the index first
-    index_manager.create_index()
-
     # Get the query engine tool
     tool = index_manager.get_query_engine_tool()
 
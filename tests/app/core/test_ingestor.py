@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import text
+
+from app.core.index_manager import IndexManager
+from app.core.ingestor import Ingestor
+from app.core.storage_manager import StorageManager
+
+
+@pytest.fixture
+def ingestor(setup_project):
+    """An ingestor writing to the project's real vector index table."""
+    vector_store = StorageManager().vector_store(setup_project)
+    yield Ingestor(
+        IndexManager.embedding_model_from_project(setup_project), vector_store
+    )
+    if vector_store.client is not None:
+        vector_store.client.dispose()
+
+
+def _stored_chunks(db, project):
+    table_name = project.vector_llama_index_name()
+    return db.execute(
+        text(
+            f"SELECT node_id, text, metadata_->>'ref_doc_id' AS ref_doc_id "
+            f"FROM {table_name} ORDER BY node_id"
+        )
+    ).all()
+
+
+def test_ingest_chunks_stores_each_chunk(db, setup_project, ingestor):
+    """Test chunks are stored under positional ids tied to their document."""
+    ingestor.ingest_chunks("ref-1", "v1", 4, ["first", "second"])
+
+    assert _stored_chunks(db, setup_project) == [
+        ("ref-1:v1:4", "first", "ref-1"),
+        ("ref-1:v1:5", "second", "ref-1"),
+    ]
+
+
+def test_ingest_chunks_retry_replaces_earlier_attempt(db, setup_project, ingestor):
+    """Test a retried batch leaves one row per chunk id, holding the new text."""
+    ingestor.ingest_chunks("ref-1", "v1", 0, ["first", "second"])
+    ingestor.ingest_chunks("ref-1", "v2", 0, ["other run"])
+
+    ingestor.ingest_chunks("ref-1", "v1", 0, ["first again", "second again"])
+
+    assert _stored_chunks(db, setup_project) == [
+        ("ref-1:v1:0", "first again", "ref-1"),
+        ("ref-1:v1:1", "second again", "ref-1"),
+        ("ref-1:v2:0", "other run", "ref-1"),
+    ]
@@ -5,6 +5,22 @@ from app.schemas.ai_schemas.chat.workflow_manager_context import WorkflowManager
 from llama_index.core.llms.mock import MockLLM
 
 
+@pytest.fixture(scope="module")
+def mock_llm():
+    """A MockLLM shared by the workflow tests; it keeps no state between calls."""
+    return MockLLM()
+
+
+@pytest.fixture(scope="module")
+def mock_query_tool():
+    """A stand-in for the index's query engine tool, shared across the module."""
+    tool = MagicMock()
+    tool.__name__ = "query_index"
+    tool.metadata = MagicMock()
+    tool.metadata.name = "query_index"
+    return tool
+
+
 class TestWorkflowManager:
     """Test cases for WorkflowManager class."""
 
@@ -52,159 +68,45 @@ class TestWorkflowManager:
         assert workflow_manager.logger is not None
 
     @pytest.mark.asyncio
-    async def test_create_workflow_with_system_prompt_id(
-        self, db, setup_project, setup_system_prompt
-    ):
-        """Test creating workflow with a specific system prompt ID."""
-        project = setup_project
-        system_prompt = setup_system_prompt
-
-        # Create context with system_prompt_id
-        context = WorkflowManagerContext(
-            db_session=db, project=project, system_prompt_id=system_prompt.prompt_id
-        )
-
-        workflow_manager = WorkflowManager(context)
-
-        # Create a proper mock for the query engine tool
-        mock_query_tool = MagicMock()
-        mock_query_tool.__name__ = "query_index"  # Add the __name__ attribute
-        mock_query_tool.metadata = MagicMock()
-        mock_query_tool.metadata.name = "query_index"
-
-        # Mock the LLM and tools to avoid actual LLM calls
-        with (
-            patch.object(workflow_manager.index_manager, "llm") as mock_llm,
-            patch.object(
-                workflow_manager.index_manager, "get_query_engine_tool"
-            ) as mock_get_query_tool,
-            patch.object(workflow_manager, "get_tools") as mock_get_tools,
-        ):
-
-            mock_llm.return_value = MockLLM()
-            mock_get_query_tool.return_value = mock_query_tool
-            mock_get_tools.return_value = []
-
-            # Create workflow
-            workflow = await workflow_manager.create_workflow()
-
-            # Verify workflow was created
-            assert workflow is not None
-
-            # Verify the system prompt from the prompt service was used
-            # (The actual verification would be in the workflow creation logic)
-
-    @pytest.mark.asyncio
-    async def test_create_workflow_with_uuid_system_prompt_id(
-        self, db, setup_project, setup_system_prompt
-    ):
-        """Test creating workflow with a UUID system prompt ID."""
-        project = setup_project
-        system_prompt = setup_system_prompt
-
-        # Create context with UUID system_prompt_id
-        context = WorkflowManagerContext(
-            db_session=db, project=project, system_prompt_id=system_prompt.id
-        )
-
-        workflow_manager = WorkflowManager(context)
-
-        # Create a proper mock for the query engine tool
-        mock_query_tool = MagicMock()
-        mock_query_tool.__name__ = "query_index"  # Add the __name__ attribute
-        mock_query_tool.metadata = MagicMock()
-        mock_query_tool.metadata.name = "query_index"
-
-        # Mock the LLM and tools to avoid actual LLM calls
-        with (
-            patch.object(workflow_manager.index_manager, "llm") as mock_llm,
-            patch.object(
-                workflow_manager.index_manager, "get_query_engine_tool"
-            ) as mock_get_query_tool,
-            patch.object(workflow_manager, "get_tools") as mock_get_tools,
-        ):
-
-            mock_llm.return_value = MockLLM()
-            mock_get_query_tool.return_value = mock_query_tool
-            mock_get_tools.return_value = []
-
-            # Create workflow
-            workflow = await workflow_manager.create_workflow()
-
-            # Verify workflow was created
-            assert workflow is not None
-
-            # Verify the system prompt from the prompt service was used
-            # (The actual verification would be in the workflow creation logic)
-
-    @pytest.mark.asyncio
-    async def test_create_workflow_with_invalid_system_prompt_id(
-        self, db, setup_project
+    @pytest.mark.parametrize(
+        "system_prompt_id",
+        [
+            lambda system_prompt: system_prompt.prompt_id,
+            lambda system_prompt: system_prompt.id,
+            # Unknown ids fall back to the project default
+            lambda system_prompt: "invalid-prompt-id",
+            lambda system_prompt: None,
+        ],
+        ids=["prompt_id", "uuid", "invalid_prompt_id", "no_prompt_id"],
+    )
+    async def test_create_workflow(
+        self,
+        db,
+        setup_project,
+        setup_system_prompt,
+        mock_llm,
+        mock_query_tool,
+        system_prompt_id,
     ):
-        """Test creating workflow with an invalid system prompt ID falls back to project default."""
-        project = setup_project
-
-        # Create context with invalid system_prompt_id
+        """Test creating a workflow for each way of selecting the system prompt."""
         context = WorkflowManagerContext(
-            db_session=db, project=project, system_prompt_id="invalid-prompt-id"
+            db_session=db,
+            project=setup_project,
+            system_prompt_id=system_prompt_id(setup_system_prompt),
         )
 
         workflow_manager = WorkflowManager(context)
 
-        # Create a proper mock for the query engine tool
-        mock_query_tool = MagicMock()
-        mock_query_tool.__name__ = "query_index"  # Add the __name__ attribute
-        mock_query_tool.metadata = MagicMock()
-        mock_query_tool.metadata.name = "query_index"
-
-        # Mock the LLM and tools to avoid actual LLM calls
-        with (
-            patch.object(workflow_manager.index_manager, "llm") as mock_llm,
-            patch.object(
-                workflow_manager.index_manager, "get_query_engine_tool"
-            ) as mock_get_query_tool,
-            patch.object(workflow_manager, "get_tools") as mock_get_tools,
-        ):
-
-            mock_llm.return_value = MockLLM()
-            mock_get_query_tool.return_value = mock_query_tool
-            mock_get_tools.return_value = []
-
-            # Create workflow
-            workflow = await workflow_manager.create_workflow()
-
-            # Verify workflow was created (should fall back to project default)
-            assert workflow is not None
-
-    @pytest.mark.asyncio
-    async def test_create_workflow_without_system_prompt_id(self, db, setup_project):
-        """Test creating workflow without system_prompt_id uses project default."""
-        project = setup_project
-
-        # Create context without system_prompt_id
-        context = WorkflowManagerContext(db_session=db, project=project)
-
-        workflow_manager = WorkflowManager(context)
-
-        # Create a proper mock for the query engine tool
-        mock_query_tool = MagicMock()
-        mock_query_tool.__name__ = "query_index"  # Add the __name__ attribute
-        mock_query_tool.metadata = MagicMock()
-        mock_query_tool.metadata.name = "query_index"
-
         # Mock the LLM and tools to avoid actual LLM calls
         with (
-            patch.object(workflow_manager.index_manager, "llm") as mock_llm,
+            patch.object(workflow_manager.index_manager, "llm", return_value=mock_llm),
             patch.object(
-                workflow_manager.index_manager, "get_query_engine_tool"
-            ) as mock_get_query_tool,
-            patch.object(workflow_manager, "get_tools") as mock_get_tools,
+                workflow_manager.index_manager,
+                "get_query_engine_tool",
+                return_value=mock_query_tool,
+            ),
+            patch.object(workflow_manager, "get_tools", return_value=[]),
         ):
-
-            mock_llm.return_value = MockLLM()
-            mock_get_query_tool.return_value = mock_query_tool
-            mock_get_tools.return_value = []
-
             # Create workflow
             workflow = await workflow_manager.create_workflow()
 
@@ -59,11 +59,14 @@ def test_ingest_text_without_labels(client, setup_project):
         # No labels provided
     }
 
-    with patch("app.core.ingestor.Ingestor.ingest_raw_text") as mock_ingest:
-        mock_ingest.return_value = None
+    with patch("app.routers.ingest.ingest_project_text") as mock_ingest:
+        mock_ingest.delay.return_value.id = "task-123"
         response = client.post(f"/projects/{project.id}/ingest/text", json=request_data)
 
         assert response.status_code == 200
         assert response.json()["data"]["status"] == "queued"
         assert response.json()["data"]["detail"] == "Text ingestion scheduled."
-        assert response.json()["data"]["task_id"] is not None
+        assert response.json()["data"]["task_id"] == "task-123"
+        mock_ingest.delay.assert_called_once_with(
+            str(project.id), "test-ref-123", "This is a test text to be ingested", None
+        )
@@ -407,3 +407,51 @@ def test_get_workspace_stats_different_workspace(client, setup_different_workspa
     assert data["plugin_stats"]["total_disabled"] == 0
     assert data["credential_stats"]["total_credentials"] == 0
     assert data["credential_stats"]["recent_credentials"] == []
+
+
+def test_list_workspaces_query_count_is_constant(
+    client, db, setup_user, setup_workspace, faker, count_queries
+):
+    """Test listing workspaces doesn't issue a query per workspace."""
+    from app.constants.membership import MembershipRoles
+    from app.models.membership import Membership
+    from app.models.user import User
+    from app.models.workspace import Workspace
+
+    for _ in range(3):
+        creator = User(
+            email=faker.email(),
+            username=faker.user_name(),
+            first_name=faker.first_name(),
+            last_name=faker.last_name(),
+            provider="google",
+            external_id=faker.uuid4(),
+        )
+        db.add(creator)
+        db.flush()
+        workspace = Workspace(name=faker.name(), created_by_id=creator.id)
+        db.add(workspace)
+        db.flush()
+        db.add(
+            Membership(
+                user_id=setup_user.id,
+                workspace_id=workspace.id,
+                role=MembershipRoles.COLLABORATOR,
+                created_by_id=creator.id,
+            )
+        )
+    db.commit()
+    # Keep only the authenticated user around so creators must be loaded
+    for instance in list(db):
+        if instance is not setup_user:
+            db.expunge(instance)
+    db.refresh(setup_user)
+
+    with count_queries() as statements:
+        response = client.get("/workspaces")
+
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 4
+    assert all(item["created_by"] is not None for item in items)
+    assert len(statements) <= 2
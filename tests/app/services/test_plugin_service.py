@@ -1,4 +1,5 @@
 import pytest
+from uuid import uuid4
 from app.services.plugin_service import PluginService
 from app.schemas.plugin import PluginCreate
 from app.constants.plugin_states import PluginState
@@ -82,3 +83,51 @@ class TestPluginService:
         with pytest.raises(ValueError) as exc_info:
             plugin_service.get_plugin(created_plugin.id)
         assert str(exc_info.value) == f"Plugin with ID {created_plugin.id} not found"
+
+    def test_get_project_plugins_merges_global_and_project_plugins(
+        self, plugin_service, sample_plugin_data, setup_project
+    ):
+        global_plugin = plugin_service.create_plugin(
+            sample_plugin_data.model_copy(
+                update={"name": "Global Plugin", "is_global": True, "is_enabled": True}
+            )
+        )
+        project_plugin = plugin_service.create_plugin(
+            sample_plugin_data.model_copy(update={"name": "Project Plugin"})
+        )
+        disabled_plugin = plugin_service.create_plugin(
+            sample_plugin_data.model_copy(update={"name": "Disabled Plugin"})
+        )
+        plugin_service.enable_plugin_in_project(
+            setup_project.id, project_plugin.id, True, [], [], []
+        )
+        plugin_service.enable_plugin_in_project(
+            setup_project.id, disabled_plugin.id, False, [], [], []
+        )
+
+        plugins = plugin_service.get_project_plugins(setup_project.id)
+
+        plugin_ids = [plugin.id for plugin in plugins]
+        assert sorted(plugin_ids) == sorted([global_plugin.id, project_plugin.id])
+
+    def test_get_project_plugins_unknown_project(self, plugin_service):
+        assert plugin_service.get_project_plugins(uuid4()) == []
+
+    def test_get_project_plugins_without_metadata(
+        self, plugin_service, sample_plugin_data, setup_project
+    ):
+        plugin = plugin_service.create_plugin(
+            sample_plugin_data.model_copy(update={"tools": [{"name": "tool"}]})
+        )
+        plugin_service.enable_plugin_in_project(
+            setup_project.id, plugin.id, True, [], [], []
+        )
+
+        plugins = plugin_service.get_project_plugins(
+            setup_project.id, include_metadata=False
+        )
+
+        assert [p.id for p in plugins] == [plugin.id]
+        assert plugins[0].tools == [{"name": "tool"}]
+        assert "prompts" not in plugins[0].__dict__
+        assert "resources" not in plugins[0].__dict__
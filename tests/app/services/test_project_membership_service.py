@@ -1,11 +1,13 @@
 from sqlalchemy.orm import Session
 
 from app.services.project_membership_service import ProjectMembershipService
+from app.services.workspace_service import WorkspaceService
 from app.schemas.project_membership import (
     ProjectMembershipCreate,
     ProjectMembershipUpdate,
 )
 from app.constants.membership import ProjectMembershipRoles
+from app.utils.cache import workspace_stats_cache
 
 
 def test_create_project_membership(db: Session, setup_user, setup_project):
@@ -62,3 +64,62 @@ def test_search_project_memberships(db: Session, setup_project_membership):
 
     results = service.search({"role": {"operator": "in", "value": [m.role]}})
     assert len(results) >= 1
+
+
+def test_get_memberships_by_user(db: Session, setup_project_membership):
+    service = ProjectMembershipService(db)
+    m = setup_project_membership
+
+    memberships = service.get_memberships_by_user(m.user_id)
+    assert len(memberships) == 1
+    assert "project" in memberships[0].__dict__
+    assert memberships[0].project.id == m.project_id
+
+
+def test_create_project_memberships(
+    db: Session, setup_user, setup_another_user, setup_project
+):
+    service = ProjectMembershipService(db)
+    memberships_in = [
+        ProjectMembershipCreate(
+            user_id=user.id,
+            project_id=setup_project.id,
+            role=ProjectMembershipRoles.COLLABORATOR,
+            created_by_id=setup_user.id,
+        )
+        for user in (setup_user, setup_another_user)
+    ]
+
+    memberships = service.create_project_memberships(memberships_in)
+
+    assert len(memberships) == 2
+    assert all(m.id is not None for m in memberships)
+    assert [m.user_id for m in memberships] == [setup_user.id, setup_another_user.id]
+    assert len(service.get_memberships_by_project(setup_project.id)) == 2
+
+
+def test_create_project_memberships_invalidates_workspace_stats(
+    db: Session, setup_user, setup_another_user, setup_project
+):
+    workspace_id = setup_project.workspace_id
+    WorkspaceService(db).get_workspace_stats_for_user(
+        workspace_id, setup_another_user.id
+    )
+    assert workspace_stats_cache.exists(str(workspace_id))
+
+    ProjectMembershipService(db).create_project_memberships(
+        [
+            ProjectMembershipCreate(
+                user_id=setup_another_user.id,
+                project_id=setup_project.id,
+                role=ProjectMembershipRoles.COLLABORATOR,
+                created_by_id=setup_user.id,
+            )
+        ]
+    )
+
+    assert not workspace_stats_cache.exists(str(workspace_id))
+
+
+def test_create_project_memberships_empty(db: Session):
+    assert ProjectMembershipService(db).create_project_memberships([]) == []
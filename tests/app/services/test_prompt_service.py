@@ -143,6 +143,32 @@ def test_get_prompt_by_id_or_prompt_id_with_string(db: Session, setup_prompt):
     assert retrieved_prompt.prompt == prompt.prompt
 
 
+def test_get_prompt_by_id_or_prompt_id_prefers_id_over_uuid_prompt_id(
+    db: Session, setup_prompt, setup_user, setup_workspace, sample_prompt_data
+):
+    """Test a UUID-shaped string matches prompt_id too, but id wins on a tie."""
+    service = PromptService(db)
+    other = service.create_prompt(
+        PromptCreate(
+            **{
+                **sample_prompt_data,
+                "prompt_id": str(setup_prompt.id),
+                "created_by_id": setup_user.id,
+                "workspace_id": setup_workspace.id,
+            }
+        )
+    )
+
+    assert service.get_prompt_by_id_or_prompt_id(str(setup_prompt.id)).id == (
+        setup_prompt.id
+    )
+
+    uuid_prompt_id = str(uuid4())
+    other.prompt_id = uuid_prompt_id
+    db.commit()
+    assert service.get_prompt_by_id_or_prompt_id(uuid_prompt_id).id == other.id
+
+
 def test_get_prompt_by_id_or_prompt_id_not_found(db: Session):
     """Test retrieving a non-existent prompt using the flexible method."""
     # Try to get non-existent prompt by UUID
@@ -220,6 +246,31 @@ def test_update_prompt_not_found(db: Session):
     assert updated_prompt is None
 
 
+def test_update_prompt_soft_deleted(db: Session, setup_prompt):
+    """Test a soft-deleted prompt is not updated."""
+    prompt_service = PromptService(db)
+    prompt_service.delete_prompt(setup_prompt.id)
+
+    updated_prompt = prompt_service.update_prompt(
+        setup_prompt.id, PromptUpdate(name="Updated Prompt")
+    )
+
+    assert updated_prompt is None
+
+
+def test_update_prompt_invalidates_workspace_stats(db: Session, setup_prompt):
+    """Test updating a prompt drops its workspace's cached stats."""
+    from app.services.workspace_service import WorkspaceService
+    from app.utils.cache import workspace_stats_cache
+
+    WorkspaceService(db).get_workspace_stats(setup_prompt.workspace_id)
+    assert workspace_stats_cache.exists(str(setup_prompt.workspace_id))
+
+    PromptService(db).update_prompt(setup_prompt.id, PromptUpdate(name="Renamed"))
+
+    assert not workspace_stats_cache.exists(str(setup_prompt.workspace_id))
+
+
 def test_delete_prompt(db: Session, setup_prompt):
     """Test deleting a prompt."""
     prompt = setup_prompt
@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy.orm import Session
+from app.services.suggest_next_question import SuggestNextQuestionsService
+
+
+@pytest.fixture
+def service(db: Session, setup_project):
+    return SuggestNextQuestionsService(db, setup_project)
+
+
+def test_extract_questions(service):
+    """Test questions are read from the first fenced block."""
+    text = (
+        "Sure!\n```\nWhat is X?\n\n  How does Y work?  \nWhy Z?\n```\n```\nignored\n```"
+    )
+
+    assert service._extract_questions(text) == [
+        "What is X?",
+        "How does Y work?",
+        "Why Z?",
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["No questions here.", "```\nunterminated", "``````"],
+)
+def test_extract_questions_without_content(service, text):
+    """Test outputs without a usable fenced block yield None."""
+    assert service._extract_questions(text) is None
+
+
+@pytest.mark.asyncio
+async def test_suggest_next_questions_requires_user_and_assistant(service, monkeypatch):
+    """Test the LLM is not called without a user/assistant exchange."""
+    from app.schemas.ai_schemas.chat.chat_api_message import ChatAPIMessage
+
+    def fail_llm(*args, **kwargs):
+        raise AssertionError("LLM should not be called")
+
+    monkeypatch.setattr("app.core.index_manager.IndexManager", fail_llm)
+
+    messages = [
+        ChatAPIMessage(role="system", content="You are helpful."),
+        ChatAPIMessage(role="user", content="Hi"),
+    ]
+    assert await service.suggest_next_questions_all_messages(messages) is None
+    assert await service.suggest_next_questions_all_messages([]) is None
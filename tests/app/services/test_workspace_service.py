@@ -604,3 +604,235 @@ def test_create_workspace_with_system_prompt(db: Session, setup_user, faker):
 
     assert updated_workspace is not None
     assert updated_workspace.system_prompt == "New workspace system prompt"
+
+
+def test_get_workspace_stats_excludes_soft_deleted(
+    db: Session, setup_workspace, setup_project, setup_prompt
+):
+    """Test get_workspace_stats ignores soft-deleted projects and prompts."""
+    from app.services.project_service import ProjectService
+    from app.services.prompt_service import PromptService
+
+    workspace = setup_workspace
+    ProjectService(db).delete_record(setup_project.id)
+    PromptService(db).delete_prompt(setup_prompt.id)
+
+    stats = WorkspaceService(db).get_workspace_stats(workspace.id)
+
+    assert stats is not None
+    assert stats.project_stats.total_projects == 0
+    assert stats.project_stats.recent_projects == []
+    assert stats.prompt_stats.total_prompts == 0
+    assert stats.prompt_stats.recent_prompts == []
+
+
+def test_get_workspace_stats_cache_invalidated_on_change(
+    db: Session, setup_workspace, setup_project
+):
+    """Test cached workspace stats are dropped when workspace resources change."""
+    from app.utils.cache import workspace_stats_cache
+
+    workspace = setup_workspace
+    service = WorkspaceService(db)
+
+    stats = service.get_workspace_stats(workspace.id)
+    assert stats.project_stats.total_projects == 1
+    assert workspace_stats_cache.exists(str(workspace.id))
+
+    setup_project.name = "Renamed Project"
+    db.commit()
+    assert not workspace_stats_cache.exists(str(workspace.id))
+
+    stats = service.get_workspace_stats(workspace.id)
+    assert stats.project_stats.recent_projects[0].name == "Renamed Project"
+
+
+def test_get_workspace_stats_cache_kept_until_commit(
+    db: Session, setup_workspace, setup_project
+):
+    """Test flushed changes only invalidate cached stats once committed."""
+    from app.utils.cache import workspace_stats_cache
+
+    workspace = setup_workspace
+    WorkspaceService(db).get_workspace_stats(workspace.id)
+
+    setup_project.name = "Renamed Project"
+    db.flush()
+    assert workspace_stats_cache.exists(str(workspace.id))
+
+    db.commit()
+    assert not workspace_stats_cache.exists(str(workspace.id))
+
+
+def test_get_workspace_stats_for_user(
+    db: Session, setup_user, setup_workspace, setup_project, setup_prompt
+):
+    """Test per-user stats report the projects the member can access."""
+    stats = WorkspaceService(db).get_workspace_stats_for_user(
+        setup_workspace.id, setup_user.id
+    )
+
+    assert stats is not None
+    assert stats.project_stats.total_projects == 1
+    assert stats.project_stats.recent_projects[0].id == setup_project.id
+    assert stats.prompt_stats.total_prompts == 1
+    assert stats.prompt_stats.recent_prompts[0].id == setup_prompt.id
+
+
+def test_get_workspace_stats_for_user_nonexistent_workspace(db: Session, setup_user):
+    """Test per-user stats return None for an unknown workspace."""
+    assert (
+        WorkspaceService(db).get_workspace_stats_for_user(uuid4(), setup_user.id)
+        is None
+    )
+
+
+def test_get_workspace_stats_for_project_member(
+    db: Session, setup_another_user, setup_another_user_membership, setup_project
+):
+    """Test project members only see projects they belong to."""
+    from app.constants.membership import MembershipRoles, ProjectMembershipRoles
+    from app.models.project_membership import ProjectMembership
+
+    user = setup_another_user
+    workspace_id = setup_project.workspace_id
+    setup_another_user_membership.role = MembershipRoles.PROJECT_MEMBER
+    db.commit()
+    service = WorkspaceService(db)
+
+    stats = service.get_workspace_stats_for_user(workspace_id, user.id)
+    assert stats.project_stats.total_projects == 0
+    assert stats.project_stats.recent_projects == []
+
+    db.add(
+        ProjectMembership(
+            user_id=user.id,
+            project_id=setup_project.id,
+            role=ProjectMembershipRoles.COLLABORATOR,
+            created_by_id=user.id,
+        )
+    )
+    db.commit()
+
+    stats = service.get_workspace_stats_for_user(workspace_id, user.id)
+    assert stats.project_stats.total_projects == 1
+    assert stats.project_stats.recent_projects[0].id == setup_project.id
+
+
+def test_get_workspace_stats_cached_per_user(
+    db: Session, setup_user, setup_workspace, setup_project
+):
+    """Test per-user stats share the workspace cache entry but not its figures."""
+    from app.utils.cache import workspace_stats_cache
+
+    workspace = setup_workspace
+    service = WorkspaceService(db)
+
+    service.get_workspace_stats(workspace.id)
+    service.get_workspace_stats_for_user(workspace.id, setup_user.id)
+    assert workspace_stats_cache.read_field(str(workspace.id), "*") is not None
+    assert (
+        workspace_stats_cache.read_field(str(workspace.id), str(setup_user.id))
+        is not None
+    )
+
+    setup_project.name = "Renamed Project"
+    db.commit()
+    assert not workspace_stats_cache.exists(str(workspace.id))
+
+    stats = service.get_workspace_stats_for_user(workspace.id, setup_user.id)
+    assert stats.project_stats.recent_projects[0].name == "Renamed Project"
+
+
+def test_get_workspace_stats_loads_no_orm_instances(
+    db: Session, setup_user, setup_workspace, setup_project, setup_prompt, setup_plugin
+):
+    """Test stats read plain columns, so no relationship can lazy-load per row."""
+    from sqlalchemy import event
+
+    workspace_id, user_id = setup_workspace.id, setup_user.id
+    project_name = setup_project.name
+    loaded = []
+
+    def record(session, instance):
+        loaded.append(instance)
+
+    db.expunge_all()
+    event.listen(db, "loaded_as_persistent", record)
+    try:
+        stats = WorkspaceService(db).get_workspace_stats_for_user(workspace_id, user_id)
+    finally:
+        event.remove(db, "loaded_as_persistent", record)
+
+    assert stats.project_stats.recent_projects[0].name == project_name
+    assert loaded == []
+
+
+def test_get_workspace_stats_query_budget(
+    db: Session,
+    setup_workspace,
+    setup_project,
+    setup_prompt,
+    setup_plugin,
+    count_queries,
+):
+    """Test workspace stats take one statement cold and none once cached."""
+    from app.utils.cache import workspace_stats_cache
+
+    workspace_stats_cache.delete(str(setup_workspace.id))
+    service = WorkspaceService(db)
+
+    with count_queries() as statements:
+        service.get_workspace_stats(setup_workspace.id)
+    assert len(statements) <= 1
+
+    with count_queries() as statements:
+        service.get_workspace_stats(setup_workspace.id)
+    assert statements == []
+
+
+def test_get_workspace_stats_for_user_query_budget(
+    db: Session,
+    setup_user,
+    setup_workspace,
+    setup_project,
+    setup_prompt,
+    count_queries,
+):
+    """Test per-user stats, membership check included, take one statement."""
+    from app.utils.cache import workspace_stats_cache
+
+    workspace_stats_cache.delete(str(setup_workspace.id))
+    service = WorkspaceService(db)
+
+    with count_queries() as statements:
+        stats = service.get_workspace_stats_for_user(setup_workspace.id, setup_user.id)
+    assert len(statements) == 1
+    assert stats.project_stats.total_projects == 1
+
+
+def test_get_workspace_stats_for_non_member(
+    db: Session, setup_another_user, setup_workspace, setup_project
+):
+    """Test a user without a workspace membership sees no projects."""
+    stats = WorkspaceService(db).get_workspace_stats_for_user(
+        setup_workspace.id, setup_another_user.id
+    )
+
+    assert stats.project_stats.total_projects == 0
+    assert stats.project_stats.recent_projects == []
+
+
+def test_get_workspaces_by_user_memberships_query_budget(
+    db: Session, setup_user, setup_workspace, count_queries
+):
+    """Test listing a user's workspaces loads their creators in the same query."""
+    user_id = setup_user.id
+    db.expunge_all()
+
+    with count_queries() as statements:
+        workspaces = WorkspaceService(db).get_workspaces_by_user_memberships(user_id)
+        assert all(workspace.created_by is not None for workspace in workspaces)
+
+    assert len(workspaces) == 1
+    assert len(statements) <= 1
@@ -0,0 +1,203 @@
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import text
+
+from app.core.index_manager import IndexManager
+from app.core.ingestor import Ingestor
+from app.core.storage_manager import StorageManager
+from app.tasks.ingest_tasks import (
+    discard_text_ingest,
+    finalize_text_ingest,
+    ingest_project_text,
+    ingest_text_chunks,
+    _delete_chunks,
+    _project_ingestor,
+)
+
+
+@pytest.fixture
+def project_ingestor(setup_project):
+    """An ingestor writing to the project's real vector index table."""
+    vector_store = StorageManager().vector_store(setup_project)
+    yield Ingestor(
+        IndexManager.embedding_model_from_project(setup_project), vector_store
+    )
+    if vector_store.client is not None:
+        vector_store.client.dispose()
+
+
+@contextmanager
+def _test_session(db):
+    """Run the task's database work in the test session, which sees the project."""
+    with patch("app.tasks.ingest_tasks.db_session") as db_session:
+        db_session.return_value.__enter__.return_value = db
+        yield
+
+
+def _stored_node_ids(db, project):
+    table_name = project.vector_llama_index_name()
+    return list(
+        db.execute(text(f"SELECT node_id FROM {table_name} ORDER BY node_id")).scalars()
+    )
+
+
+def test_ingest_project_text_stages_batches_and_fans_out():
+    """Test chunk batches are staged in Redis and stored by subtasks."""
+    labels = {"source": "test"}
+
+    with (
+        patch(
+            "app.tasks.ingest_tasks.Ingestor.split_raw_text",
+            return_value=["first", "second", "third"],
+        ),
+        patch("app.tasks.ingest_tasks.ingest_chunks_cache") as cache,
+        patch("app.tasks.ingest_tasks.chord") as chord,
+        patch("app.tasks.ingest_tasks.CHUNKS_PER_SUBTASK", 2),
+    ):
+        cache.write_field.return_value = True
+        ingest_project_text("project-id", "ref-1", "first second third", labels)
+
+    staged = [call.args for call in cache.write_field.call_args_list]
+    version = staged[0][0]
+    assert staged == [
+        (version, "0", ["first", "second"]),
+        (version, "2", ["third"]),
+    ]
+
+    # Subtask messages carry ids only, never the chunk text
+    header = chord.call_args.args[0]
+    assert [sig.task for sig in header] == [ingest_text_chunks.name] * 2
+    assert [sig.args for sig in header] == [
+        ("project-id", "ref-1", version, 0, labels),
+        ("project-id", "ref-1", version, 2, labels),
+    ]
+
+    body = chord.return_value.call_args.args[0]
+    assert body.task == finalize_text_ingest.name
+    assert body.args[:3] == ("project-id", "ref-1", version)
+    [errback] = body.options["link_error"]
+    assert errback["task"] == discard_text_ingest.name
+    assert tuple(errback["args"]) == ("project-id", "ref-1", version)
+
+
+def test_ingest_project_text_fails_when_staging_fails():
+    """Test no subtasks are dispatched if the chunks can't be staged."""
+    with (
+        patch("app.tasks.ingest_tasks.ingest_chunks_cache") as cache,
+        patch("app.tasks.ingest_tasks.chord") as chord,
+    ):
+        cache.write_field.return_value = False
+        with pytest.raises(RuntimeError):
+            ingest_project_text("project-id", "ref-1", "some text")
+
+    chord.assert_not_called()
+
+
+def test_ingest_text_chunks_stores_staged_batch():
+    """Test a subtask embeds the batch it reads back from Redis."""
+    ingestor = MagicMock()
+    labels = {"source": "test"}
+
+    with (
+        patch("app.tasks.ingest_tasks.ingest_chunks_cache") as cache,
+        patch("app.tasks.ingest_tasks._project_ingestor") as project_ingestor,
+    ):
+        project_ingestor.return_value.__enter__.return_value = ingestor
+        cache.read_field.return_value = ["third", "fourth"]
+        stored = ingest_text_chunks("project-id", "ref-1", "v1", 2, labels)
+
+    assert stored == 2
+    cache.read_field.assert_called_once_with("v1", "2")
+    ingestor.ingest_chunks.assert_called_once_with(
+        "ref-1", "v1", 2, ["third", "fourth"], labels
+    )
+
+
+def test_ingest_text_chunks_fails_without_staged_batch():
+    """Test a subtask stores nothing once its batch is gone from Redis."""
+    with (
+        patch("app.tasks.ingest_tasks.ingest_chunks_cache") as cache,
+        patch("app.tasks.ingest_tasks._project_ingestor") as project_ingestor,
+    ):
+        cache.read_field.return_value = None
+        with pytest.raises(RuntimeError):
+            ingest_text_chunks("project-id", "ref-1", "v1", 0)
+
+    project_ingestor.assert_not_called()
+
+
+def test_finalize_text_ingest_replaces_previous_version():
+    """Test finalizing records the hash and drops the previous version."""
+    with (
+        patch("app.tasks.ingest_tasks.StorageManager") as storage_manager,
+        patch("app.tasks.ingest_tasks._delete_chunks") as delete_chunks,
+        patch("app.tasks.ingest_tasks.ingest_chunks_cache") as cache,
+    ):
+        stored = finalize_text_ingest([2, 1], "project-id", "ref-1", "v1", "hash")
+
+    assert stored == 3
+    docstore = storage_manager.return_value.get_docstore.return_value
+    docstore.set_document_hash.assert_called_once_with("ref-1", "hash")
+    delete_chunks.assert_called_once_with("project-id", "ref-1", "v1", stale=True)
+    cache.delete.assert_called_once_with("v1")
+
+
+def test_discard_text_ingest_drops_partial_version():
+    """Test a failed run's chunks are removed and the old version is kept."""
+    with (
+        patch("app.tasks.ingest_tasks._delete_chunks") as delete_chunks,
+        patch("app.tasks.ingest_tasks.ingest_chunks_cache") as cache,
+    ):
+        discard_text_ingest("project-id", "ref-1", "v1")
+
+    delete_chunks.assert_called_once_with("project-id", "ref-1", "v1", stale=False)
+    cache.delete.assert_called_once_with("v1")
+
+
+def test_project_ingestor_disposes_vector_store_engine():
+    """Test the vector store's own connection pool is closed after use."""
+    vector_store = MagicMock()
+
+    with (
+        patch("app.tasks.ingest_tasks.db_session"),
+        patch("app.tasks.ingest_tasks._get_project"),
+        patch("app.tasks.ingest_tasks.IndexManager"),
+        patch("app.tasks.ingest_tasks.StorageManager") as storage_manager,
+    ):
+        storage_manager.return_value.vector_store.return_value = vector_store
+        with _project_ingestor("project-id") as ingestor:
+            assert ingestor.vector_store is vector_store
+            vector_store.client.dispose.assert_not_called()
+
+    vector_store.client.dispose.assert_called_once_with()
+
+
+def test_delete_chunks_removes_stale_versions(db, setup_project, project_ingestor):
+    """Test finalizing drops a document's older chunks from the real index table."""
+    project_ingestor.ingest_chunks("ref-1", "v1", 0, ["old first", "old second"])
+    project_ingestor.ingest_chunks("ref-1", "v2", 0, ["new first"])
+    project_ingestor.ingest_chunks("ref-2", "v1", 0, ["other document"])
+
+    with _test_session(db):
+        _delete_chunks(str(setup_project.id), "ref-1", "v2", stale=True)
+
+    assert _stored_node_ids(db, setup_project) == ["ref-1:v2:0", "ref-2:v1:0"]
+
+
+def test_delete_chunks_discards_partial_version(db, setup_project, project_ingestor):
+    """Test discarding a failed run keeps the version that was already live."""
+    project_ingestor.ingest_chunks("ref-1", "v1", 0, ["old first", "old second"])
+    project_ingestor.ingest_chunks("ref-1", "v2", 0, ["new first"])
+
+    with _test_session(db):
+        _delete_chunks(str(setup_project.id), "ref-1", "v2", stale=False)
+
+    assert _stored_node_ids(db, setup_project) == ["ref-1:v1:0", "ref-1:v1:1"]
+
+
+def test_delete_chunks_without_index_table(db, setup_project):
+    """Test nothing fails for a project that never stored a chunk."""
+    with _test_session(db):
+        _delete_chunks(str(setup_project.id), "ref-1", "v1", stale=True)
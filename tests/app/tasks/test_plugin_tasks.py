@@ -0,0 +1,46 @@
+import asyncio
+
+from app.tasks import plugin_tasks
+
+
+def test_event_loop_is_reused_across_tasks():
+    """Test tasks in a worker process share one event loop."""
+    loop = plugin_tasks._event_loop()
+
+    assert plugin_tasks._event_loop() is loop
+    assert loop.run_until_complete(_answer()) == 42
+
+
+def test_event_loop_is_recreated_once_closed():
+    """Test a closed loop is replaced instead of reused."""
+    loop = plugin_tasks._event_loop()
+    loop.close()
+
+    assert plugin_tasks._event_loop() is not loop
+
+
+def test_run_cancels_tasks_left_pending():
+    """Test tasks a coroutine leaves behind don't outlive the Celery task."""
+    leftovers = []
+
+    async def spawn():
+        leftovers.append(asyncio.ensure_future(asyncio.sleep(3600)))
+        return 42
+
+    assert plugin_tasks._run(spawn()) == 42
+    assert leftovers[0].cancelled()
+    assert not asyncio.all_tasks(plugin_tasks._event_loop())
+
+
+def test_close_event_loop_on_worker_shutdown():
+    """Test the worker's loop is closed when its process shuts down."""
+    loop = plugin_tasks._event_loop()
+
+    plugin_tasks.close_event_loop()
+
+    assert loop.is_closed()
+    assert plugin_tasks._event_loop() is not loop
+
+
+async def _answer():
+    return 42
@@ -112,6 +112,48 @@ def test_write_redis_error(cache, mock_redis):
     assert result is False
 
 
+def test_read_field_cache_hit(cache, mock_redis):
+    """Test reading a hash field from cache when it exists."""
+    mock_redis.hget.return_value = json.dumps({"value": 1})
+
+    result = cache.read_field("test-key", "field")
+
+    assert result == {"value": 1}
+    mock_redis.hget.assert_called_once_with("test:test-key", "field")
+
+
+def test_read_field_cache_miss(cache, mock_redis):
+    """Test reading a hash field from cache when it doesn't exist."""
+    mock_redis.hget.return_value = None
+
+    assert cache.read_field("test-key", "field") is None
+
+
+def test_write_field_success(cache, mock_redis):
+    """Test writing a hash field sets the value and renews the hash TTL."""
+    pipeline = mock_redis.pipeline.return_value
+
+    result = cache.write_field("test-key", "field", {"value": 1}, ttl=30)
+
+    assert result is True
+    pipeline.hset.assert_called_once_with(
+        "test:test-key", "field", json.dumps({"value": 1})
+    )
+    pipeline.expire.assert_called_once_with("test:test-key", 30)
+    pipeline.execute.assert_called_once()
+
+
+def test_write_field_redis_error(cache, mock_redis):
+    """Test writing a hash field when Redis connection fails."""
+    from redis import ConnectionError
+
+    mock_redis.pipeline.return_value.execute.side_effect = ConnectionError(
+        "Connection failed"
+    )
+
+    assert cache.write_field("test-key", "field", {"value": 1}) is False
+
+
 def test_delete_success(cache, mock_redis):
     """Test deleting from cache successfully."""
     mock_redis.delete.return_value = 1
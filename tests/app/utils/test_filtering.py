@@ -0,0 +1,32 @@
+from sqlalchemy.orm import Session
+from app.models.workspace import Workspace
+from app.utils.db.filtering import apply_filters
+
+
+def test_apply_filters_combines_conditions(db: Session, setup_workspace):
+    """Test equality and operator conditions are all applied."""
+    workspace = setup_workspace
+    query = apply_filters(
+        db.query(Workspace),
+        Workspace,
+        {
+            "id": workspace.id,
+            "name": {"operator": "ilike", "value": workspace.name},
+            "locked": {"operator": "!=", "value": True},
+        },
+    )
+
+    assert [w.id for w in query.all()] == [workspace.id]
+
+
+def test_apply_filters_skips_unknown_and_non_column_fields(
+    db: Session, setup_workspace
+):
+    """Test fields that are not mapped columns are ignored."""
+    query = db.query(Workspace)
+
+    filtered = apply_filters(
+        query, Workspace, {"does_not_exist": 1, "projects": [], "delete": True}
+    )
+
+    assert filtered is query
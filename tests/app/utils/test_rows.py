@@ -0,0 +1,30 @@
+from uuid import uuid4
+from app.schemas.prompt import PromptCreate, PromptUpdate
+from app.schemas.workspace import WorkspaceCreate, WorkspaceUpdate
+from app.utils.db.rows import changed_values, row_values
+
+
+def test_row_values_matches_model_dump():
+    """Test row values equal a full model_dump for create schemas."""
+    prompt = PromptCreate(
+        name="Prompt",
+        prompt_id="prompt-1",
+        type="system",
+        prompt="Content",
+        workspace_id=uuid4(),
+    )
+    workspace = WorkspaceCreate(name="Workspace", created_by_id=uuid4())
+
+    assert row_values(prompt) == prompt.model_dump()
+    assert row_values(workspace) == workspace.model_dump()
+
+
+def test_changed_values_matches_exclude_unset():
+    """Test changed values equal model_dump(exclude_unset=True)."""
+    prompt = PromptUpdate(name="Renamed", notes=None)
+    workspace = WorkspaceUpdate(locked=True)
+
+    assert changed_values(prompt) == {"name": "Renamed", "notes": None}
+    assert changed_values(prompt) == prompt.model_dump(exclude_unset=True)
+    assert changed_values(workspace) == workspace.model_dump(exclude_unset=True)
+    assert changed_values(PromptUpdate()) == {}
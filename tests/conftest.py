@@ -1,8 +1,25 @@
+import os
+import contextlib
+
+from sqlalchemy.engine import make_url
+
+from app.config import DEFAULT_TEST_DATABASE_URL
+
+# Under pytest-xdist every worker gets its own test database, so workers can
+# migrate, use and drop it without touching each other's data. This must run
+# before the app reads its settings (app.db builds its engine on import).
+_xdist_worker = os.getenv("PYTEST_XDIST_WORKER")
+if _xdist_worker:
+    _base_url = make_url(os.getenv("TEST_DATABASE_URL", DEFAULT_TEST_DATABASE_URL))
+    os.environ["TEST_DATABASE_URL"] = _base_url.set(
+        database=f"{_base_url.database}_{_xdist_worker}"
+    ).render_as_string(hide_password=False)
+
 from app.config import get_settings
 import pytest
 import logging
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from fastapi import Request
 from fastapi.security import HTTPAuthorizationCredentials
@@ -29,13 +46,23 @@ pytest_plugins = [
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
+TEST_DATABASE_NAME = make_url(settings.database_url).database
+
+
+def _maintenance_url() -> str:
+    """URL of the server's default database, used to create and drop test ones."""
+    return (
+        make_url(settings.database_url)
+        .set(database="postgres")
+        .render_as_string(hide_password=False)
+    )
 
 
 def ensure_test_database():
     """Ensure the test database exists."""
 
     # Connect to default postgres database
-    default_url = settings.database_url.replace("/quore_test", "/postgres")
+    default_url = _maintenance_url()
     engine = create_engine(default_url, isolation_level="AUTOCOMMIT")
     conn = engine.connect()
 
@@ -43,11 +70,12 @@ def ensure_test_database():
 
     # Check if test database exists
     result = conn.execute(
-        text("SELECT 1 FROM pg_database WHERE datname = 'quore_test'")
+        text("SELECT 1 FROM pg_database WHERE datname = :name"),
+        {"name": TEST_DATABASE_NAME},
     )
     if not result.scalar():
         logger.debug("Creating test database...")
-        conn.execute(text("CREATE DATABASE quore_test"))
+        conn.execute(text(f'CREATE DATABASE "{TEST_DATABASE_NAME}"'))
     else:
         logger.debug("Test database already exists")
 
@@ -58,7 +86,7 @@ def ensure_test_database():
 def drop_test_database():
     """Drop the test database."""
     # Connect to default postgres database (not the test database)
-    default_url = settings.database_url.replace("/quore_test", "/postgres")
+    default_url = _maintenance_url()
     engine = create_engine(default_url, isolation_level="AUTOCOMMIT")
     conn = engine.connect()
 
@@ -68,13 +96,14 @@ def drop_test_database():
             """
         SELECT pg_terminate_backend(pid) 
         FROM pg_stat_activity 
-        WHERE datname = 'quore_test' AND pid <> pg_backend_pid()
+        WHERE datname = :name AND pid <> pg_backend_pid()
     """
-        )
+        ),
+        {"name": TEST_DATABASE_NAME},
     )
 
     # Drop the test database
-    conn.execute(text("DROP DATABASE IF EXISTS quore_test"))
+    conn.execute(text(f'DROP DATABASE IF EXISTS "{TEST_DATABASE_NAME}"'))
     conn.close()
     engine.dispose()
 
@@ -113,8 +142,9 @@ def db(engine):
     connection = engine.connect()
     transaction = connection.begin()
 
-    # bind an individual Session to the connection
-    Session = sessionmaker(bind=connection)
+    # bind an individual Session to the connection; its commits and rollbacks
+    # only release or roll back SAVEPOINTs inside the outer transaction
+    Session = sessionmaker(bind=connection, join_transaction_mode="create_savepoint")
     session = Session()
 
     yield session
@@ -131,6 +161,32 @@ def db(engine):
     connection.close()
 
 
+@pytest.fixture(scope="function")
+def count_queries(db):
+    """
+    Record the SQL statements issued on the test connection.
+
+    Use as ``with count_queries() as statements:`` and assert on
+    ``len(statements)`` to hold a code path to a query budget.
+    """
+
+    @contextlib.contextmanager
+    def _count_queries():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        bind = db.get_bind()
+        event.listen(bind, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(bind, "before_cursor_execute", record)
+
+    return _count_queries
+
+
 @pytest.fixture(scope="function")
 def faker():
     """Create a Faker instance for generating test data."""
@@ -5,6 +5,33 @@ from app.models.invitation import Invitation
 from app.constants.membership import MembershipRoles
 
 
+@pytest.fixture
+def invitation_factory(db, setup_workspace, setup_user, faker):
+    """
+    Build and persist invitations on demand.
+
+    Defaults to a pending collaborator invitation to ``setup_workspace`` sent by
+    ``setup_user``; keyword arguments override any column.
+    """
+
+    def _create(**overrides):
+        values = {
+            "email": faker.email(),
+            "workspace_id": setup_workspace.id,
+            "role": MembershipRoles.COLLABORATOR,
+            "message": faker.text(100),
+            "inviter_id": setup_user.id,
+            "expires_at": datetime.now(timezone.utc) + timedelta(hours=24),
+            **overrides,
+        }
+        invitation = Invitation(**values)
+        db.add(invitation)
+        db.flush()
+        return invitation
+
+    return _create
+
+
 @pytest.fixture
 def setup_invitation(db, setup_workspace, setup_user, faker):
     """Create a basic invitation fixture."""
@@ -17,7 +44,7 @@ def setup_invitation(db, setup_workspace, setup_user, faker):
         expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
     )
     db.add(invitation)
-    db.commit()
+    db.flush()
     db.refresh(invitation)
     return invitation
 
@@ -34,7 +61,7 @@ def setup_expired_invitation(db, setup_workspace, setup_user, faker):
         expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
     )
     db.add(invitation)
-    db.commit()
+    db.flush()
     db.refresh(invitation)
     return invitation
 
@@ -55,7 +82,7 @@ def setup_multiple_invitations(db, setup_workspace, setup_user, faker):
         db.add(invitation)
         invitations.append(invitation)
 
-    db.commit()
+    db.flush()
     for invitation in invitations:
         db.refresh(invitation)
 
@@ -76,7 +103,7 @@ def setup_invitation_for_user_email(
         expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
     )
     db.add(invitation)
-    db.commit()
+    db.flush()
     db.refresh(invitation)
     return invitation
 
@@ -98,7 +125,7 @@ def setup_invitation_for_current_user(
         expires_at=datetime.now(timezone.utc) + timedelta(hours=24),
     )
     db.add(invitation)
-    db.commit()
+    db.flush()
     db.refresh(invitation)
     return invitation
 
@@ -108,6 +135,6 @@ def setup_invitation_for_wrong_email(db, setup_invitation):
     """Create an invitation for a wrong email."""
     invitation = setup_invitation
     invitation.email = "wrong@example.com"
-    db.commit()
+    db.flush()
     db.refresh(invitation)
     return invitation